@@ -1,5 +1,7 @@
 # assets/admin.py
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Case, CharField, Value, When
 from .models import Asset, ComputerDetail, StorageDevice, GraphicsCard
 
 
@@ -13,9 +15,40 @@ class GraphicsCardInline(admin.TabularInline):
     extra = 1
 
 
+class AssetChangeList(ChangeList):
+    """Changelist that only loads the columns shown in list_display."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .only(
+                "inventory_code",
+                "asset_type",
+                "status",
+                "employee__first_name",
+                "employee__last_name",
+                "department__name",
+            )
+            .annotate(
+                display_type=Case(
+                    *[
+                        When(asset_type=value, then=Value(label))
+                        for value, label in Asset.AssetTypeChoices.choices
+                    ],
+                    default="asset_type",
+                    output_field=CharField(),
+                )
+            )
+        )
+
+
 class AssetAdmin(admin.ModelAdmin):
 
-    list_display = ("inventory_code", "asset_type", "status", "employee", "department")
+    list_display = ("inventory_code", "display_type", "status", "employee", "department")
+
+    # Join the FK columns shown in list_display instead of one query per row
+    list_select_related = ("employee", "department")
 
     list_filter = ("status", "asset_type", "department")
 
@@ -27,8 +60,21 @@ class AssetAdmin(admin.ModelAdmin):
         "employee__rut",
     )
 
+    # Load employee/department choices on demand instead of rendering every
+    # row into the change form's <select>
+    autocomplete_fields = ("employee", "department")
+
     inlines = [StorageDeviceInline, GraphicsCardInline]
 
+    @admin.display(description="Tipo de Activo", ordering="asset_type")
+    def display_type(self, obj):
+        # Labelled in SQL by AssetChangeList instead of a choices lookup per row
+        return obj.display_type
+
+    def get_changelist(self, request, **kwargs):
+        # Scoped to the changelist so the change form still gets full rows
+        return AssetChangeList
+
 
 admin.site.register(Asset, AssetAdmin)
 admin.site.register(ComputerDetail)
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-16 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_alter_asset_department"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(
+                fields=["status", "asset_type"], name="asset_status_type_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(
+                fields=["department", "status"], name="asset_dept_status_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0005_asset_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(fields=["-created_at"], name="asset_created_at_desc_idx"),
+        ),
+    ]
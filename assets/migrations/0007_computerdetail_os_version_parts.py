@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+
+def backfill_os_version_parts(apps, schema_editor):
+    from assets.models import os_version_parts
+
+    ComputerDetail = apps.get_model("assets", "ComputerDetail")
+    details = list(ComputerDetail.objects.only("pk", "os_version"))
+    for detail in details:
+        detail.os_major, detail.os_minor, detail.os_build = os_version_parts(detail.os_version)
+    ComputerDetail.objects.bulk_update(
+        details, ["os_major", "os_minor", "os_build"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0006_asset_created_at_desc_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="computerdetail",
+            name="os_major",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="computerdetail",
+            name="os_minor",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="computerdetail",
+            name="os_build",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_os_version_parts, migrations.RunPython.noop),
+    ]
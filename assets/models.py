@@ -1,8 +1,9 @@
 from django.db import models
 from users.models import Employee, Department  # Importamos desde la app 'users'
+from auditing.mixins import AuditedModelMixin
 
 
-class Asset(models.Model):
+class Asset(AuditedModelMixin, models.Model):
     class AssetTypeChoices(models.TextChoices):
         NOTEBOOK = "NOTEBOOK", "Notebook"
         DESKTOP = "DESKTOP", "Desktop"
@@ -56,10 +57,36 @@ class Asset(models.Model):
         verbose_name="Departamento (Centro de Costo)",
     )
 
+    class Meta:
+        # employee/department FKs are already indexed; these back the
+        # combined status/type/department filters used by the admin and API
+        indexes = [
+            models.Index(fields=["status", "asset_type"], name="asset_status_type_idx"),
+            # GROUP BY asset_type in analytics; status is the leading column above
+            models.Index(fields=["asset_type"], name="asset_type_idx"),
+            models.Index(fields=["department", "status"], name="asset_dept_status_idx"),
+            # Backs the list's opt-in ?ordering=-created_at (newest first); by
+            # default the cursor walks inventory_code's unique index
+            models.Index(fields=["-created_at"], name="asset_created_at_desc_idx"),
+        ]
+
     def __str__(self):
         return f"{self.inventory_code} ({self.get_asset_type_display()})"
 
 
+def os_version_parts(version_string):
+    """
+    Split an OS version like "10.0.22621" into (major, minor, build).
+    Missing parts are 0 and unparseable versions give (0, 0, 0), matching
+    how hardware_checker.parse_windows_version orders them.
+    """
+    try:
+        parts = [int(p) for p in version_string.split(".")]
+    except (ValueError, AttributeError):
+        return (0, 0, 0)
+    return tuple(parts[:3] + [0] * (3 - len(parts)))
+
+
 class ComputerDetail(models.Model):
     asset = models.OneToOneField(
         Asset,
@@ -88,9 +115,25 @@ class ComputerDetail(models.Model):
         null=True, blank=True, verbose_name="Última Actualización por Agente"
     )
 
+    # os_version parsed once on save so version rules can compare in SQL
+    os_major = models.IntegerField(default=0, editable=False)
+    os_minor = models.IntegerField(default=0, editable=False)
+    os_build = models.IntegerField(default=0, editable=False)
+
     def __str__(self):
         return f"Detalles de {self.asset.inventory_code}"
 
+    def set_os_version_parts(self):
+        """Sync os_major/os_minor/os_build with os_version (bulk_create skips save)."""
+        self.os_major, self.os_minor, self.os_build = os_version_parts(self.os_version)
+
+    def save(self, *args, **kwargs):
+        self.set_os_version_parts()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "os_version" in update_fields:
+            kwargs["update_fields"] = [*update_fields, "os_major", "os_minor", "os_build"]
+        super().save(*args, **kwargs)
+
 
 class StorageDevice(models.Model):
     asset = models.ForeignKey(
@@ -1,9 +1,16 @@
 """
 Database seeding script for SIGAT.
 Run with: python manage.py runscript seed_data
+
+By default the script does nothing if seed data is already present.
+Wipe and reload with: python manage.py runscript seed_data --script-args rebuild
 """
 
 import random
+from datetime import date, timedelta
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
 from faker import Faker
 
 from assets.models import Asset, ComputerDetail, StorageDevice, GraphicsCard
@@ -15,53 +22,131 @@ from users.models import CustomUser, Department, Employee
 # Initialize Faker with Spanish locale
 fake = Faker('es_ES')
 
+# Rows per INSERT statement when bulk-creating seed data
+ASSET_BATCH_SIZE = 50
+CHILD_BATCH_SIZE = 100
+
+
+def bulk_insert(model, objs, lookup_field, batch_size=ASSET_BATCH_SIZE, ignore_conflicts=False):
+    """
+    Insert objs with bulk_create and return them with primary keys set.
+
+    Backends that can't return rows from a bulk INSERT get the saved rows
+    re-fetched through in_bulk() keyed on a unique lookup_field. The same
+    happens with ignore_conflicts, which skips rows that already exist and
+    never sets primary keys.
+    """
+    objs = model.objects.bulk_create(
+        objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts
+    )
+
+    if ignore_conflicts or not connection.features.can_return_rows_from_bulk_insert:
+        keys = [getattr(obj, lookup_field) for obj in objs]
+        by_key = model.objects.in_bulk(keys, field_name=lookup_field)
+        objs = [by_key[key] for key in keys]
+
+    return objs
+
+
+def insert_installed_software(installs):
+    """
+    Insert InstalledSoftware rows, the largest table in the seed.
+
+    On PostgreSQL with psycopg2 the rows go through execute_values, which
+    sends pages of plain VALUES tuples and is cheaper than bulk_create's
+    per-object INSERT compilation. Other backends use bulk_create.
+    """
+    if connection.vendor != 'postgresql' or connection.Database.__name__ != 'psycopg2':
+        InstalledSoftware.objects.bulk_create(installs, batch_size=CHILD_BATCH_SIZE)
+        return
+
+    from cachalot.api import invalidate
+    from psycopg2.extras import execute_values
+
+    meta = InstalledSoftware._meta
+    columns = [
+        meta.get_field(name).column
+        for name in ('asset', 'software', 'version', 'install_date', 'license')
+    ]
+    rows = [
+        (inst.asset_id, inst.software_id, inst.version, inst.install_date, inst.license_id)
+        for inst in installs
+    ]
+
+    with connection.cursor() as cursor:
+        execute_values(
+            cursor.cursor,
+            f"INSERT INTO {meta.db_table} ({', '.join(columns)}) VALUES %s",
+            rows,
+            page_size=500,
+        )
+
+    # The raw psycopg2 cursor bypasses cachalot's invalidation on writes
+    invalidate(InstalledSoftware)
 
-def run():
-    """Main function that executes database seeding."""
+
+def run(*args):
+    """
+    Main function that executes database seeding.
+
+    Pass "rebuild" (--script-args rebuild) to wipe existing data first.
+    Without it, a database that already holds seeded assets is left as is.
+    """
+    rebuild = 'rebuild' in args
 
     print("=" * 80)
     print("STARTING SIGAT DATABASE SEEDING")
     print("=" * 80)
 
-    # Step 1: Clear existing data
-    print("\n[1/9] Clearing existing data...")
-    clear_database()
+    # Run the whole seed in one transaction so a failure leaves the database
+    # untouched and rows aren't committed one statement at a time
+    with transaction.atomic():
+        # Step 1: Clear existing data
+        if rebuild:
+            print("\n[1/9] Clearing existing data...")
+            clear_database()
+        elif Asset.objects.exists():
+            print("\nSeed data already present, nothing to do.")
+            print("Use --script-args rebuild to wipe and reload it.")
+            return
+        else:
+            print("\n[1/9] Empty database, nothing to clear...")
+        fake.unique.clear()
 
-    # Step 2: Create users
-    print("\n[2/9] Creating system users...")
-    users = create_users()
-    print(f"✓ {len(users)} users created (5 technicians, 2 admins)")
+        # Step 2: Create users
+        print("\n[2/9] Creating system users...")
+        users = create_users()
+        print(f"✓ {len(users)} users created (5 technicians, 2 admins)")
 
-    # Step 3: Create base entities
-    print("\n[3/9] Creating departments...")
-    departments = create_departments()
-    print(f"✓ {len(departments)} departments created")
+        # Step 3: Create base entities
+        print("\n[3/9] Creating departments...")
+        departments = create_departments()
+        print(f"✓ {len(departments)} departments created")
 
-    print("\n[4/9] Creating software catalog...")
-    software_catalog = create_software_catalog()
-    print(f"✓ {len(software_catalog)} software applications created")
+        print("\n[4/9] Creating software catalog...")
+        software_catalog = create_software_catalog()
+        print(f"✓ {len(software_catalog)} software applications created")
 
-    print("\n[5/9] Creating employees...")
-    employees = create_employees(departments)
-    print(f"✓ {len(employees)} employees created")
+        print("\n[5/9] Creating employees...")
+        employees = create_employees(departments)
+        print(f"✓ {len(employees)} employees created")
 
-    # Step 6: Create assets and relationships
-    print("\n[6/9] Creating assets with hardware and software details...")
-    assets = Asset.objects.all()  # We'll need to get these after creation
-    total_assets = create_assets(departments, employees, software_catalog)
+        # Step 6: Create assets and relationships
+        print("\n[6/9] Creating assets with hardware and software details...")
+        total_assets = create_assets(departments, employees, software_catalog)
 
-    # Refresh assets list
-    assets = list(Asset.objects.all())
+        # Refresh assets list
+        assets = list(Asset.objects.all())
 
-    # Step 7: Create auditing records
-    print("\n[7/9] Creating asset check-ins...")
-    total_checkins = create_asset_checkins(assets, employees)
+        # Step 7: Create auditing records
+        print("\n[7/9] Creating asset check-ins...")
+        total_checkins = create_asset_checkins(assets, employees)
 
-    print("\n[8/9] Creating compliance warnings...")
-    total_warnings = create_compliance_warnings(assets, users)
+        print("\n[8/9] Creating compliance warnings...")
+        total_warnings = create_compliance_warnings(assets, users)
 
-    print("\n[9/9] Creating audit logs...")
-    total_logs = create_audit_logs(users, assets)
+        print("\n[9/9] Creating audit logs...")
+        total_logs = create_audit_logs(users, assets)
 
     # Final summary
     print("\n" + "=" * 80)
@@ -79,7 +164,14 @@ def run():
 
 
 def clear_database():
-    """Delete all existing records from main models."""
+    """
+    Delete all existing records from main models.
+
+    Uses a single TRUNCATE ... RESTART IDENTITY CASCADE on PostgreSQL (a
+    DELETE FROM per table on SQLite) instead of loading every row into Python.
+    CASCADE also empties tables that reference these ones, such as the
+    hardware obsolescence rules, which get_rules() recreates with defaults.
+    """
 
     # Deletion order respecting dependencies
     models_to_clear = [
@@ -98,11 +190,14 @@ def clear_database():
         ('Users', CustomUser),
     ]
 
-    for name, model in models_to_clear:
-        count = model.objects.count()
-        if count > 0:
-            model.objects.all().delete()
-            print(f"  - {name}: {count} records deleted")
+    tables = [model._meta.db_table for _, model in models_to_clear]
+    sql_list = connection.ops.sql_flush(
+        no_style(), tables, reset_sequences=True, allow_cascade=True
+    )
+    connection.ops.execute_sql_flush(sql_list)
+
+    for name, _ in models_to_clear:
+        print(f"  - {name}: cleared")
 
 
 def create_departments():
@@ -118,11 +213,15 @@ def create_departments():
         "Recursos Humanos",
     ]
 
-    departments = []
-    for name in department_names:
-        dept = Department.objects.create(name=name)
-        departments.append(dept)
-        print(f"  - {name}")
+    # Departments created by hand before seeding are reused, not duplicated
+    departments = bulk_insert(
+        Department,
+        [Department(name=name) for name in department_names],
+        'name',
+        ignore_conflicts=True,
+    )
+    for dept in departments:
+        print(f"  - {dept.name}")
 
     return departments
 
@@ -131,51 +230,35 @@ def create_users():
     """Create technician and admin users."""
 
     users = []
-    used_usernames = set()
-
-    # Create 5 technicians
-    print("  Creating technicians...")
-    for i in range(5):
-        # Generate unique username
-        while True:
-            first = fake.first_name().lower()
-            last = fake.last_name().lower()
-            username = f"{first}.{last}"
-            if username not in used_usernames:
-                used_usernames.add(username)
-                break
-
-        user = CustomUser.objects.create_user(
-            username=username,
-            password='password123',
-            email=f"{username}@universidad.cl",
-            role=CustomUser.RoleChoices.TECHNICIAN,
-            is_active=True
-        )
-        users.append(user)
-        print(f"    - Technician: {username}")
-
-    # Create 2 admins
-    print("  Creating administrators...")
-    for i in range(2):
-        # Generate unique username
-        while True:
-            first = fake.first_name().lower()
-            last = fake.last_name().lower()
-            username = f"{first}.{last}.admin"
-            if username not in used_usernames:
-                used_usernames.add(username)
-                break
-
-        user = CustomUser.objects.create_user(
+
+    # Hash the shared demo password once instead of once per user
+    hashed_password = make_password('password123')
+
+    # 5 technicians and 2 admins
+    roles = [CustomUser.RoleChoices.TECHNICIAN] * 5 + [CustomUser.RoleChoices.ADMIN] * 2
+
+    # Distinct first names make every first.last username distinct, so no
+    # retry loop is needed
+    first_names = [fake.unique.first_name().lower() for _ in roles]
+    last_names = [fake.last_name().lower() for _ in roles]
+
+    for role, first, last in zip(roles, first_names, last_names):
+        suffix = ".admin" if role == CustomUser.RoleChoices.ADMIN else ""
+        username = f"{first}.{last}{suffix}"
+
+        users.append(CustomUser(
             username=username,
-            password='password123',
+            password=hashed_password,
             email=f"{username}@universidad.cl",
-            role=CustomUser.RoleChoices.ADMIN,
+            role=role,
+            # bulk_create skips CustomUser.save(), which sets is_staff for admins
+            is_staff=role == CustomUser.RoleChoices.ADMIN,
             is_active=True
-        )
-        users.append(user)
-        print(f"    - Admin: {username}")
+        ))
+
+    users = bulk_insert(CustomUser, users, 'username')
+    for user in users:
+        print(f"    - {user.get_role_display()}: {user.username}")
 
     return users
 
@@ -201,50 +284,63 @@ def create_software_catalog():
         ("LibreOffice", "The Document Foundation"),
     ]
 
-    catalog = []
-    for name, developer in software_data:
-        software = SoftwareCatalog.objects.create(
-            name=name,
-            developer=developer
+    # Entries that already exist are skipped instead of failing the seed
+    SoftwareCatalog.objects.bulk_create(
+        [SoftwareCatalog(name=name, developer=developer) for name, developer in software_data],
+        batch_size=ASSET_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+    # ignore_conflicts never sets PKs, so re-fetch on (name, developer),
+    # which is unique together
+    by_key = {
+        (software.name, software.developer): software
+        for software in SoftwareCatalog.objects.filter(
+            name__in=[name for name, _ in software_data]
         )
-        catalog.append(software)
-        print(f"  - {name} ({developer})")
+    }
+    catalog = [by_key[key] for key in software_data]
+
+    for software in catalog:
+        print(f"  - {software.name} ({software.developer})")
 
     return catalog
 
 
-def generate_rut():
-    """Generate a Chilean RUT with format XX.XXX.XXX-X."""
+# Check digit indexed by (weighted digit sum % 11), i.e. 11 - (sum % 11)
+# with 11 -> '0' and 10 -> 'K'
+RUT_CHECK_DIGITS = "0K987654321"
+RUT_FACTORS = (2, 3, 4, 5, 6, 7, 2, 3)
+
+
+def format_rut(number):
+    """Format a RUT body number as XX.XXX.XXX-X, computing its check digit."""
+
+    # Weighted sum of the digits from the right, using integer arithmetic
+    # instead of string conversion
+    s = 0
+    remaining = number
+    for factor in RUT_FACTORS:
+        s += (remaining % 10) * factor
+        remaining //= 10
 
-    # Generate base number (7-8 digits)
-    number = random.randint(10000000, 25999999)
+    verifier = RUT_CHECK_DIGITS[s % 11]
 
-    # Calculate verification digit
-    reversed_digits = map(int, reversed(str(number)))
-    factors = [2, 3, 4, 5, 6, 7]
-    s = sum(d * factors[i % 6] for i, d in enumerate(reversed_digits))
-    verifier = 11 - (s % 11)
+    return f"{number // 1000000}.{number // 1000 % 1000:03d}.{number % 1000:03d}-{verifier}"
 
-    if verifier == 11:
-        verifier = '0'
-    elif verifier == 10:
-        verifier = 'K'
-    else:
-        verifier = str(verifier)
 
-    # Format RUT
-    rut_str = str(number)
-    formatted_rut = f"{rut_str[:-6]}.{rut_str[-6:-3]}.{rut_str[-3:]}-{verifier}"
+def generate_ruts(count):
+    """Generate count distinct Chilean RUTs with format XX.XXX.XXX-X."""
 
-    return formatted_rut
+    # Sample distinct base numbers (7-8 digits) so no retry loop is needed
+    numbers = random.sample(range(10000000, 25999999), count)
+    return [format_rut(number) for number in numbers]
 
 
 def create_employees(departments):
     """Create employees with realistic data using Faker."""
 
-    employees = []
-    used_ruts = set()
-    used_emails = set()
+    TOTAL_EMPLOYEES = 25
 
     positions = [
         "Profesor", "Investigador", "Asistente Administrativo",
@@ -252,33 +348,26 @@ def create_employees(departments):
         "Bibliotecario", "Contador", "Desarrollador"
     ]
 
-    for i in range(25):
-        # Generate unique RUT
-        while True:
-            rut = generate_rut()
-            if rut not in used_ruts:
-                used_ruts.add(rut)
-                break
-
-        # Generate unique email
-        while True:
-            email = fake.email()
-            if email not in used_emails:
-                used_emails.add(email)
-                break
-
-        employee = Employee.objects.create(
+    # Generate every column up front; RUTs and emails come out already unique
+    ruts = generate_ruts(TOTAL_EMPLOYEES)
+    emails = [fake.unique.email() for _ in range(TOTAL_EMPLOYEES)]
+    first_names = [fake.first_name() for _ in range(TOTAL_EMPLOYEES)]
+    last_names = [f"{fake.last_name()} {fake.last_name()}" for _ in range(TOTAL_EMPLOYEES)]
+
+    employees = [
+        Employee(
             rut=rut,
-            first_name=fake.first_name(),
-            last_name=f"{fake.last_name()} {fake.last_name()}",
+            first_name=first_name,
+            last_name=last_name,
             email=email,
             position=random.choice(positions),
             department=random.choice(departments)
         )
-        employees.append(employee)
+        for rut, email, first_name, last_name in zip(ruts, emails, first_names, last_names)
+    ]
 
-        if (i + 1) % 5 == 0:
-            print(f"  - {i + 1} employees created...")
+    employees = bulk_insert(Employee, employees, 'rut')
+    print(f"  - {len(employees)} employees created...")
 
     return employees
 
@@ -287,7 +376,6 @@ def create_assets(departments, employees, software_catalog):
     """Create assets with their hardware and installed software details."""
 
     TOTAL_ASSETS = 150
-    created_count = 0
 
     # Lists for generating realistic data
     notebook_brands = ["Dell", "HP", "Lenovo", "Asus", "Acer", "Apple"]
@@ -328,124 +416,177 @@ def create_assets(departments, employees, software_catalog):
         "Intel Iris Xe Graphics",
     ]
 
+    # Pre-generate Faker data in batch instead of calling Faker per row
+    serial_numbers = [fake.unique.bothify(text='??########').upper() for _ in range(TOTAL_ASSETS)]
+    model_names = [fake.bothify(text='Model-####') for _ in range(TOTAL_ASSETS)]
+    acquisition_dates = [
+        fake.date_between(start_date='-3y', end_date='today') for _ in range(TOTAL_ASSETS)
+    ]
+    unique_identifiers = [fake.uuid4() for _ in range(TOTAL_ASSETS)]
+    motherboard_models = [fake.bothify(text='MB-####') for _ in range(TOTAL_ASSETS)]
+    # Up to two disks per asset
+    storage_serials = iter(
+        [fake.bothify(text='S??########').upper() for _ in range(TOTAL_ASSETS * 2)]
+    )
+
+    # Draw every random selection in one random.choices() call per column
+    # (only NOTEBOOK or DESKTOP as per requirements)
+    asset_types = random.choices(
+        [Asset.AssetTypeChoices.NOTEBOOK, Asset.AssetTypeChoices.DESKTOP], k=TOTAL_ASSETS
+    )
+    notebook_brand_picks = random.choices(notebook_brands, k=TOTAL_ASSETS)
+    desktop_brand_picks = random.choices(desktop_brands, k=TOTAL_ASSETS)
+    statuses = random.choices([
+        Asset.StatusChoices.IN_STORAGE,
+        Asset.StatusChoices.ASSIGNED,
+        Asset.StatusChoices.IN_REPAIR,
+        Asset.StatusChoices.DISPOSED,
+    ], k=TOTAL_ASSETS)
+    employee_picks = random.choices(employees, k=TOTAL_ASSETS)
+    department_picks = random.choices(departments, k=TOTAL_ASSETS)
+
+    os_picks = random.choices(operating_systems, k=TOTAL_ASSETS)
+    cpu_picks = random.choices(cpu_models, k=TOTAL_ASSETS)
+    ram_picks = random.choices([4, 8, 16, 32], k=TOTAL_ASSETS)
+    motherboard_picks = random.choices(motherboard_manufacturers, k=TOTAL_ASSETS)
+    primary_capacities = random.choices([256, 512, 1024, 2048], k=TOTAL_ASSETS)
+    secondary_capacities = random.choices([512, 1024, 2048], k=TOTAL_ASSETS)
+    # Free space is 20-70% of the primary disk and 30-80% of the secondary one
+    primary_free_spaces = [
+        round(capacity * random.uniform(0.2, 0.7), 2) for capacity in primary_capacities
+    ]
+    secondary_free_spaces = [
+        round(capacity * random.uniform(0.3, 0.8), 2) for capacity in secondary_capacities
+    ]
+    primary_storage_models = random.choices(storage_models, k=TOTAL_ASSETS)
+    secondary_storage_models = random.choices(storage_models, k=TOTAL_ASSETS)
+    gpu_picks = random.choices(gpu_models, k=TOTAL_ASSETS)
+    software_counts = random.choices([2, 3, 4, 5], k=TOTAL_ASSETS)
+
+    # Installed software is sliced from a shuffled copy of the catalog through
+    # a moving cursor; reshuffling only when the window runs past the end
+    # keeps each asset's picks distinct without a random.sample() per asset
+    software_pool = list(software_catalog)
+    random.shuffle(software_pool)
+    software_cursor = 0
+
+    # Install dates are sampled as a day offset from the acquisition date
+    today = date.today()
+
+    # Pass 1: build every Asset in memory and insert them in batches
+    assets = []
     for i in range(TOTAL_ASSETS):
-        # Determine asset type (only NOTEBOOK or DESKTOP as per requirements)
-        asset_type = random.choice([
-            Asset.AssetTypeChoices.NOTEBOOK,
-            Asset.AssetTypeChoices.DESKTOP
-        ])
+        asset_type = asset_types[i]
 
         # Generate inventory code with format UPLA-TYPE-NNNN
         type_code = "NOTE" if asset_type == Asset.AssetTypeChoices.NOTEBOOK else "DESK"
         inventory_code = f"UPLA-{type_code}-{i+1:04d}"
 
-        # Generate unique serial number
-        serial_number = fake.bothify(text='??########').upper()
-
         # Select brand based on type
         if asset_type == Asset.AssetTypeChoices.NOTEBOOK:
-            brand = random.choice(notebook_brands)
+            brand = notebook_brand_picks[i]
         else:
-            brand = random.choice(desktop_brands)
+            brand = desktop_brand_picks[i]
 
-        # Select random status
-        status = random.choice([
-            Asset.StatusChoices.IN_STORAGE,
-            Asset.StatusChoices.ASSIGNED,
-            Asset.StatusChoices.IN_REPAIR,
-            Asset.StatusChoices.DISPOSED,
-        ])
+        status = statuses[i]
 
         # Assign employee only if status is ASSIGNED
         assigned_employee = None
         if status == Asset.StatusChoices.ASSIGNED:
-            assigned_employee = random.choice(employees)
-
-        # Acquisition date (last 3 years)
-        acquisition_date = fake.date_between(start_date='-3y', end_date='today')
+            assigned_employee = employee_picks[i]
 
-        # Create the asset
-        asset = Asset.objects.create(
+        assets.append(Asset(
             inventory_code=inventory_code,
-            serial_number=serial_number,
+            serial_number=serial_numbers[i],
             asset_type=asset_type,
             status=status,
             brand=brand,
-            model=fake.bothify(text='Model-####'),
-            acquisition_date=acquisition_date,
+            model=model_names[i],
+            # Acquisition date (last 3 years)
+            acquisition_date=acquisition_dates[i],
             employee=assigned_employee,
-            department=random.choice(departments)
-        )
-
-        # Create associated ComputerDetail
-        os_name, os_version, os_arch = random.choice(operating_systems)
-        ComputerDetail.objects.create(
+            department=department_picks[i]
+        ))
+
+    assets = bulk_insert(Asset, assets, 'inventory_code')
+    print(f"  - {len(assets)}/{TOTAL_ASSETS} assets inserted...")
+
+    # Pass 2: build hardware and software children without touching the DB
+    details = []
+    storages = []
+    gpus = []
+    installs = []
+
+    for i, asset in enumerate(assets):
+        # Associated ComputerDetail
+        os_name, os_version, os_arch = os_picks[i]
+        detail = ComputerDetail(
             asset=asset,
-            unique_identifier=fake.uuid4(),
+            unique_identifier=unique_identifiers[i],
             os_name=os_name,
             os_version=os_version,
             os_arch=os_arch,
-            cpu_model=random.choice(cpu_models),
-            ram_gb=random.choice([4, 8, 16, 32]),
-            motherboard_manufacturer=random.choice(motherboard_manufacturers),
-            motherboard_model=fake.bothify(text='MB-####'),
+            cpu_model=cpu_picks[i],
+            ram_gb=ram_picks[i],
+            motherboard_manufacturer=motherboard_picks[i],
+            motherboard_model=motherboard_models[i],
             last_updated_by_agent=None
         )
+        detail.set_os_version_parts()
+        details.append(detail)
 
-        # Create at least one StorageDevice
-        primary_capacity = random.choice([256, 512, 1024, 2048])
-        free_space = primary_capacity * random.uniform(0.2, 0.7)
-
-        StorageDevice.objects.create(
+        # At least one StorageDevice
+        storages.append(StorageDevice(
             asset=asset,
-            model=random.choice(storage_models),
-            serial_number=fake.bothify(text='S??########').upper(),
-            capacity_gb=primary_capacity,
-            free_space_gb=round(free_space, 2)
-        )
+            model=primary_storage_models[i],
+            serial_number=next(storage_serials),
+            capacity_gb=primary_capacities[i],
+            free_space_gb=primary_free_spaces[i]
+        ))
 
         # 50% chance of having a second disk
         if random.random() < 0.5:
-            secondary_capacity = random.choice([512, 1024, 2048])
-            secondary_free_space = secondary_capacity * random.uniform(0.3, 0.8)
-
-            StorageDevice.objects.create(
+            storages.append(StorageDevice(
                 asset=asset,
-                model=random.choice(storage_models),
-                serial_number=fake.bothify(text='S??########').upper(),
-                capacity_gb=secondary_capacity,
-                free_space_gb=round(secondary_free_space, 2)
-            )
+                model=secondary_storage_models[i],
+                serial_number=next(storage_serials),
+                capacity_gb=secondary_capacities[i],
+                free_space_gb=secondary_free_spaces[i]
+            ))
 
-        # Create GraphicsCard (optional, 70% probability)
+        # GraphicsCard (optional, 70% probability)
         if random.random() < 0.7:
-            GraphicsCard.objects.create(
+            gpus.append(GraphicsCard(
                 asset=asset,
-                model_name=random.choice(gpu_models)
-            )
+                model_name=gpu_picks[i]
+            ))
 
         # Install between 2 and 5 software programs (no duplicates)
-        software_count = random.randint(2, 5)
-        selected_software = random.sample(software_catalog, software_count)
-
+        software_count = software_counts[i]
+        if software_cursor + software_count > len(software_pool):
+            random.shuffle(software_pool)
+            software_cursor = 0
+        selected_software = software_pool[software_cursor:software_cursor + software_count]
+        software_cursor += software_count
+
+        days_since_acquisition = (today - asset.acquisition_date).days
         for software in selected_software:
-            InstalledSoftware.objects.create(
+            installs.append(InstalledSoftware(
                 asset=asset,
                 software=software,
                 version=f"{random.randint(1, 20)}.{random.randint(0, 9)}.{random.randint(0, 99)}",
-                install_date=fake.date_between(
-                    start_date=acquisition_date,
-                    end_date='today'
+                install_date=asset.acquisition_date + timedelta(
+                    days=random.randint(0, days_since_acquisition)
                 ),
                 license=None  # No license assignment in this basic seed
-            )
-
-        created_count += 1
+            ))
 
-        # Show progress every 25 assets
-        if created_count % 25 == 0:
-            print(f"  - {created_count}/{TOTAL_ASSETS} assets created...")
+    ComputerDetail.objects.bulk_create(details, batch_size=CHILD_BATCH_SIZE)
+    StorageDevice.objects.bulk_create(storages, batch_size=CHILD_BATCH_SIZE)
+    GraphicsCard.objects.bulk_create(gpus, batch_size=CHILD_BATCH_SIZE)
+    insert_installed_software(installs)
 
+    created_count = len(assets)
     print(f"  - {created_count}/{TOTAL_ASSETS} assets created... Completed!")
     return created_count
 
@@ -477,29 +618,27 @@ def create_asset_checkins(assets, employees):
         print("  No assigned assets found. Skipping check-ins.")
         return 0
 
-    checkins_created = 0
+    checkins = []
 
     # Distribute check-ins across assigned assets
     # Some assets may have multiple historical check-ins
-    while checkins_created < TARGET_CHECKINS and assigned_assets:
+    for _ in range(TARGET_CHECKINS):
         asset = random.choice(assigned_assets)
 
         # Create check-in for this asset
         checkin_date = fake.date_time_between(start_date='-6M', end_date='now')
 
-        AssetCheckin.objects.create(
+        checkins.append(AssetCheckin(
             asset=asset,
             employee=asset.employee,
             checkin_date=checkin_date,
             physical_state=random.choice(physical_states),
             performance_satisfaction=random.randint(1, 5),
             notes=random.choice(sample_notes) if random.random() < 0.5 else ""
-        )
-
-        checkins_created += 1
+        ))
 
-        if checkins_created % 10 == 0:
-            print(f"  - {checkins_created}/{TARGET_CHECKINS} check-ins created...")
+    AssetCheckin.objects.bulk_create(checkins, batch_size=CHILD_BATCH_SIZE)
+    checkins_created = len(checkins)
 
     print(f"  - {checkins_created}/{TARGET_CHECKINS} check-ins created... Completed!")
     return checkins_created
@@ -570,10 +709,11 @@ def create_compliance_warnings(assets, users):
         ],
     }
 
-    warnings_created = 0
+    warnings = []
+    asset_picks = random.choices(computer_assets, k=len(statuses_distribution))
+    resolver_picks = random.choices(users, k=len(statuses_distribution))
 
-    for status in statuses_distribution:
-        asset = random.choice(computer_assets)
+    for status, asset, resolver in zip(statuses_distribution, asset_picks, resolver_picks):
 
         # Generate 1-3 evidence paths
         num_paths = random.randint(1, 3)
@@ -585,12 +725,11 @@ def create_compliance_warnings(assets, users):
         resolution_notes = ""
 
         if status != ComplianceWarning.StatusChoices.NEW:
-            resolved_by = random.choice(users)
+            resolved_by = resolver
             if status in resolution_notes_samples:
                 resolution_notes = random.choice(resolution_notes_samples[status])
 
-        # Create the compliance warning
-        ComplianceWarning.objects.create(
+        warnings.append(ComplianceWarning(
             asset=asset,
             detection_date=fake.date_time_between(start_date='-3M', end_date='now'),
             category="SOFTWARE_NO_LICENCIADO",
@@ -599,12 +738,10 @@ def create_compliance_warnings(assets, users):
             status=status,
             resolved_by=resolved_by,
             resolution_notes=resolution_notes
-        )
-
-        warnings_created += 1
+        ))
 
-        if warnings_created % 10 == 0:
-            print(f"  - {warnings_created}/{TARGET_WARNINGS} compliance warnings created...")
+    ComplianceWarning.objects.bulk_create(warnings, batch_size=CHILD_BATCH_SIZE)
+    warnings_created = len(warnings)
 
     print(f"  - {warnings_created}/{TARGET_WARNINGS} compliance warnings created... Completed!")
     return warnings_created
@@ -656,12 +793,12 @@ def create_audit_logs(users, assets):
         },
     }
 
-    logs_created = 0
+    logs = []
+    action_picks = random.choices(actions, k=TARGET_LOGS)
+    table_picks = random.choices(target_tables, k=TARGET_LOGS)
+    user_picks = random.choices(users, k=TARGET_LOGS)
 
-    for _ in range(TARGET_LOGS):
-        action = random.choice(actions)
-        table = random.choice(target_tables)
-        user = random.choice(users)
+    for action, table, user in zip(action_picks, table_picks, user_picks):
 
         # Get sample details for this table and action
         details = sample_details[table][action].copy()
@@ -672,19 +809,17 @@ def create_audit_logs(users, assets):
         # Random target_id
         target_id = random.randint(1, 200)
 
-        AuditLog.objects.create(
+        logs.append(AuditLog(
             system_user=user,
             action=action,
             target_table=table,
             target_id=target_id,
             details=details,
             timestamp=fake.date_time_between(start_date='-6M', end_date='now')
-        )
-
-        logs_created += 1
+        ))
 
-        if logs_created % 10 == 0:
-            print(f"  - {logs_created}/{TARGET_LOGS} audit logs created...")
+    AuditLog.objects.bulk_create(logs, batch_size=CHILD_BATCH_SIZE)
+    logs_created = len(logs)
 
     print(f"  - {logs_created}/{TARGET_LOGS} audit logs created... Completed!")
     return logs_created
@@ -63,6 +63,54 @@ class AssetListSerializer(serializers.ModelSerializer):
         ]
 
 
+# Columns read by asset_list_row, plus the fields the list can be ordered by
+# (CursorPagination reads the ordering field off each row)
+ASSET_LIST_VALUES = (
+    "inventory_code",
+    "serial_number",
+    "asset_type",
+    "brand",
+    "model",
+    "status",
+    "created_at",
+    "updated_at",
+    "department_id",
+    "department__name",
+    "employee_id",
+    "employee__rut",
+    "employee__first_name",
+    "employee__last_name",
+    "employee__email",
+)
+
+
+def asset_list_row(row):
+    """
+    Build the AssetListSerializer representation from an ASSET_LIST_VALUES
+    row, without instantiating models or nested serializers.
+    """
+    department_id = row["department_id"]
+    employee_id = row["employee_id"]
+    return {
+        "inventory_code": row["inventory_code"],
+        "serial_number": row["serial_number"],
+        "asset_type": row["asset_type"],
+        "brand": row["brand"],
+        "model": row["model"],
+        "status": row["status"],
+        "department": None if department_id is None else {
+            "id": department_id,
+            "name": row["department__name"],
+        },
+        "employee": None if employee_id is None else {
+            "id": employee_id,
+            "rut": row["employee__rut"],
+            "full_name": f"{row['employee__first_name']} {row['employee__last_name']}",
+            "email": row["employee__email"],
+        },
+    }
+
+
 class AssetDetailSerializer(serializers.ModelSerializer):
 
     department = DepartmentBasicSerializer(read_only=True)
@@ -93,5 +141,24 @@ class AssetDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Asset
-        fields = "__all__"
+        fields = [
+            "id",
+            "department",
+            "employee",
+            "computerdetail",
+            "storage_devices",
+            "graphics_cards",
+            "installed_software",
+            "department_id",
+            "employee_id",
+            "inventory_code",
+            "serial_number",
+            "asset_type",
+            "status",
+            "brand",
+            "model",
+            "acquisition_date",
+            "created_at",
+            "updated_at",
+        ]
         read_only_fields = ["created_at", "updated_at"]
@@ -0,0 +1,63 @@
+"""
+Keep Asset.updated_at in step with the rows rendered in the asset detail,
+whose ETag is built from it (see assets.views.asset_detail_etag). Covers
+writes from the API and the admin alike.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from software.models import InstalledSoftware, SoftwareCatalog
+from .models import Asset, ComputerDetail, GraphicsCard, StorageDevice
+
+# Set inside asset_touch_disabled()
+_touch_disabled = ContextVar('asset_touch_disabled', default=False)
+
+
+@contextmanager
+def asset_touch_disabled():
+    """
+    Don't touch assets for the child writes inside this block. For callers
+    that change the ETag themselves, like the agent report, which rewrites
+    every child row and sets computerdetail.last_updated_by_agent.
+    """
+    token = _touch_disabled.set(True)
+    try:
+        yield
+    finally:
+        _touch_disabled.reset(token)
+
+
+def touch_assets(**filters):
+    """Move updated_at forward on the matching assets."""
+    Asset.objects.filter(**filters).update(updated_at=timezone.now())
+
+
+@receiver(pre_save, sender=InstalledSoftware, dispatch_uid='installed_software_previous_asset')
+def remember_previous_asset(sender, instance, **kwargs):
+    """An edited row may move to another asset, which must be touched too."""
+    if instance.pk and not _touch_disabled.get():
+        instance._previous_asset_id = (
+            InstalledSoftware.objects.filter(pk=instance.pk).values_list('asset_id', flat=True).first()
+        )
+
+
+@receiver([post_save, post_delete], sender=ComputerDetail, dispatch_uid='touch_asset_computer_detail')
+@receiver([post_save, post_delete], sender=StorageDevice, dispatch_uid='touch_asset_storage_device')
+@receiver([post_save, post_delete], sender=GraphicsCard, dispatch_uid='touch_asset_graphics_card')
+@receiver([post_save, post_delete], sender=InstalledSoftware, dispatch_uid='touch_asset_installed_software')
+def touch_parent_asset(sender, instance, origin=None, **kwargs):
+    """Child rows have no timestamp of their own."""
+    # Rows deleted along with their asset leave nothing to touch
+    if _touch_disabled.get() or isinstance(origin, Asset):
+        return
+    asset_ids = {instance.asset_id, getattr(instance, '_previous_asset_id', None)} - {None}
+    touch_assets(pk__in=asset_ids)
+
+
+@receiver(post_save, sender=SoftwareCatalog, dispatch_uid='touch_assets_software_catalog')
+def touch_assets_with_software(sender, instance, created, **kwargs):
+    """The asset detail renders the name and developer of installed software."""
+    if not created and not _touch_disabled.get():
+        touch_assets(installed_software__software=instance)
@@ -1,7 +1,9 @@
 import pytest
 from rest_framework.test import APIClient
 from users.models import Department, Employee, CustomUser
-from assets.models import Asset
+from assets.models import Asset, ComputerDetail, StorageDevice, GraphicsCard
+from assets.serializers import AssetListSerializer
+from software.models import SoftwareCatalog, InstalledSoftware
 
 
 @pytest.fixture
@@ -74,6 +76,104 @@ def test_list_assets_as_technician(api_client, technician_user, setup_data):
     assert "serial_number" not in asset_data
 
 
+@pytest.mark.django_db
+def test_list_assets_renders_json(api_client, technician_user, setup_data):
+    """
+    test list response body is plain json with the paginated envelope
+    """
+    Asset.objects.create(
+        inventory_code="TEST-006",
+        serial_number="SN006",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+        department=setup_data["department"],
+    )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/assets/")
+
+    assert response["Content-Type"] == "application/json"
+    body = response.json()
+    assert body["previous"] is None
+    assert body["results"][0]["department"]["name"] == "Departamento de Prueba"
+
+
+@pytest.mark.django_db
+def test_list_assets_rows_match_list_serializer(api_client, technician_user, setup_data):
+    """
+    test the flat list rows have the same shape as AssetListSerializer
+    """
+    assigned = Asset.objects.create(
+        inventory_code="TEST-007",
+        serial_number="SN007",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+        brand="Dell",
+        department=setup_data["department"],
+        employee=setup_data["employee"],
+    )
+    unassigned = Asset.objects.create(
+        inventory_code="TEST-008",
+        serial_number="SN008",
+        asset_type=Asset.AssetTypeChoices.MONITOR,
+    )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/assets/")
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        AssetListSerializer(assigned).data,
+        AssetListSerializer(unassigned).data,
+    ]
+
+
+@pytest.mark.django_db
+def test_list_assets_cursor_pagination(api_client, technician_user):
+    """
+    test list pages by inventory_code using the next cursor link
+    """
+    for code in ["TEST-C", "TEST-A", "TEST-B"]:
+        Asset.objects.create(
+            inventory_code=code,
+            serial_number=f"SN-{code}",
+            asset_type=Asset.AssetTypeChoices.MONITOR,
+        )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/assets/?page_size=2")
+
+    assert response.status_code == 200
+    assert [a["inventory_code"] for a in response.data["results"]] == ["TEST-A", "TEST-B"]
+
+    response = api_client.get(response.data["next"])
+
+    assert [a["inventory_code"] for a in response.data["results"]] == ["TEST-C"]
+    assert response.data["next"] is None
+
+
+@pytest.mark.django_db
+def test_list_assets_reflects_employee_changes(api_client, technician_user, setup_data):
+    """
+    test list rows reflect changes to the assigned employee
+    """
+    employee = setup_data["employee"]
+    Asset.objects.create(
+        inventory_code="TEST-005",
+        serial_number="SN005",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+        employee=employee,
+    )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/assets/")
+    assert response.data["results"][0]["employee"]["full_name"] == "Usuario DePrueba"
+
+    employee.last_name = "Renombrado"
+    employee.save()
+
+    response = api_client.get("/api/assets/")
+    assert response.data["results"][0]["employee"]["full_name"] == "Usuario Renombrado"
+
+
 @pytest.mark.django_db
 def test_retrieve_asset_as_technician(api_client, technician_user, setup_data):
     """
@@ -123,3 +223,119 @@ def test_create_asset_as_technician(api_client, technician_user, setup_data):
     new_asset = Asset.objects.get()
     assert new_asset.inventory_code == "TEST-003"
     assert new_asset.employee.id == employee.id
+
+
+@pytest.mark.django_db
+def test_retrieve_asset_query_count_is_constant(
+    api_client, technician_user, setup_data, django_assert_num_queries
+):
+    """
+    test asset detail doesnt run one query per storage device, gpu or installed software
+    """
+    asset = Asset.objects.create(
+        inventory_code="TEST-004",
+        serial_number="SN004",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+        department=setup_data["department"],
+        employee=setup_data["employee"],
+    )
+    ComputerDetail.objects.create(asset=asset, cpu_model="Intel Core i5", ram_gb=8)
+    for i in range(3):
+        StorageDevice.objects.create(asset=asset, model=f"Disk {i}", capacity_gb=256)
+        GraphicsCard.objects.create(asset=asset, model_name=f"GPU {i}")
+        software = SoftwareCatalog.objects.create(name=f"App {i}", developer="Dev")
+        InstalledSoftware.objects.create(asset=asset, software=software, version="1.0")
+
+    api_client.force_authenticate(user=technician_user)
+
+    # etag, asset + joins, storage devices, graphics cards, installed software
+    with django_assert_num_queries(5):
+        response = api_client.get(f"/api/assets/{asset.inventory_code}/")
+
+    assert response.status_code == 200
+    assert response.data["computerdetail"]["ram_gb"] == 8
+    assert len(response.data["storage_devices"]) == 3
+    assert len(response.data["graphics_cards"]) == 3
+    assert len(response.data["installed_software"]) == 3
+
+
+@pytest.mark.django_db
+def test_retrieve_asset_not_modified(api_client, technician_user, setup_data):
+    """
+    test asset detail answers 304 for a matching etag until the asset changes
+    """
+    asset = Asset.objects.create(
+        inventory_code="TEST-009",
+        serial_number="SN009",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+        employee=setup_data["employee"],
+    )
+    url = f"/api/assets/{asset.inventory_code}/"
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get(url)
+    etag = response["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    employee = setup_data["employee"]
+    employee.first_name = "Otro"
+    employee.save()
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["employee"]["full_name"] == "Otro DePrueba"
+
+
+@pytest.mark.django_db
+def test_retrieve_asset_etag_changes_with_installed_software(api_client, technician_user):
+    """
+    test asset detail etag changes when its installed software is edited through the api
+    """
+    asset = Asset.objects.create(
+        inventory_code="TEST-010",
+        serial_number="SN010",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+    )
+    software = SoftwareCatalog.objects.create(name="App", developer="Dev")
+    installed = InstalledSoftware.objects.create(asset=asset, software=software, version="1.0")
+    url = f"/api/assets/{asset.inventory_code}/"
+
+    api_client.force_authenticate(user=technician_user)
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.patch(
+        f"/api/installed-software/{installed.id}/", {"version": "2.0"}, format="json"
+    )
+    assert response.status_code == 200
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.data["installed_software"][0]["version"] == "2.0"
+
+
+
+@pytest.mark.django_db
+def test_retrieve_asset_etag_changes_with_hardware_edits(api_client, technician_user):
+    """
+    test asset detail etag changes when a child row is edited outside the api, as the admin does
+    """
+    asset = Asset.objects.create(
+        inventory_code="TEST-011",
+        serial_number="SN011",
+        asset_type=Asset.AssetTypeChoices.DESKTOP,
+    )
+    gpu = GraphicsCard.objects.create(asset=asset, model_name="GTX 1050")
+    url = f"/api/assets/{asset.inventory_code}/"
+
+    api_client.force_authenticate(user=technician_user)
+    etag = api_client.get(url)["ETag"]
+
+    gpu.model_name = "RTX 3060"
+    gpu.save()
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["graphics_cards"][0]["model_name"] == "RTX 3060"
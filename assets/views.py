@@ -1,24 +1,63 @@
+import hashlib
 import logging
 from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.response import Response
+from django.db.models import Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
+from software.models import InstalledSoftware
 from .models import Asset
-from .serializers import AssetListSerializer, AssetDetailSerializer
+from .serializers import (
+    AssetListSerializer,
+    AssetDetailSerializer,
+    ASSET_LIST_VALUES,
+    asset_list_row,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class AssetPagination(PageNumberPagination):
+class AssetPagination(CursorPagination):
     """
     Custom pagination class for assets.
+    Pages are keyset ranges over the unique inventory_code index, so deep
+    pages cost the same as the first one. Follow the next/previous links.
     Allows clients to request custom page sizes up to max_page_size.
     """
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
+    ordering = 'inventory_code'
+
+
+def asset_detail_etag(request, inventory_code):
+    """
+    ETag for the asset detail response, built from one small query.
+    Covers the asset itself, the last agent report (which rewrites hardware
+    and software rows) and the embedded employee/department fields. Other
+    writes to the rendered child rows move the asset's updated_at instead
+    (see assets.signals).
+    """
+    row = (
+        Asset.objects.filter(inventory_code=inventory_code)
+        .values_list(
+            'updated_at',
+            'computerdetail__last_updated_by_agent',
+            'department__name',
+            'employee__rut',
+            'employee__first_name',
+            'employee__last_name',
+            'employee__email',
+        )
+        .first()
+    )
+    if row is None:
+        return None
+    return hashlib.md5(repr(row).encode(), usedforsecurity=False).hexdigest()
 
 
 class AssetViewSet(viewsets.ModelViewSet):
@@ -26,13 +65,13 @@ class AssetViewSet(viewsets.ModelViewSet):
     API endpoint that allows assets to be viewed or edited.
 
     Supports:
-    - Pagination: ?page=2&page_size=50
+    - Pagination: ?page_size=50, then follow the next/previous cursor links
     - Search: ?search=Dell (searches inventory_code, serial_number, brand, model, department, employee)
-    - Ordering: ?ordering=brand or ?ordering=-inventory_code
+    - Ordering: ?ordering=-created_at or ?ordering=-inventory_code (default: inventory_code)
     - Filters: ?asset_type=NOTEBOOK&status=ASIGNADO&department=1
     """
 
-    queryset = Asset.objects.select_related('department', 'employee').order_by("-created_at")
+    queryset = Asset.objects.select_related('department', 'employee')
     permission_classes = [IsAuthenticated]
     lookup_field = "inventory_code"
 
@@ -50,7 +89,8 @@ class AssetViewSet(viewsets.ModelViewSet):
         'employee__first_name',
         'employee__last_name',
     ]
-    ordering_fields = ['inventory_code', 'brand', 'model', 'status', 'asset_type', 'created_at', 'updated_at']
+    # Cursor pagination needs unique or non-null columns to page on
+    ordering_fields = ['inventory_code', 'created_at', 'updated_at']
     filterset_fields = {
         'asset_type': ['exact'],
         'status': ['exact'],
@@ -59,23 +99,67 @@ class AssetViewSet(viewsets.ModelViewSet):
         'inventory_code': ['exact', 'istartswith'],
     }
 
+    def get_queryset(self):
+        """
+        Join or prefetch every relation the active serializer renders so the
+        number of queries doesn't grow with the number of rows. The list
+        action reads plain values() rows instead of model instances.
+        """
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            # Flat rows, reshaped by asset_list_row
+            queryset = queryset.values(*ASSET_LIST_VALUES)
+        else:
+            queryset = queryset.select_related('computerdetail').prefetch_related(
+                'storage_devices',
+                'graphics_cards',
+                Prefetch(
+                    'installed_software',
+                    queryset=InstalledSoftware.objects.select_related('software').only(
+                        'asset_id',
+                        'version',
+                        'install_date',
+                        'software__name',
+                        'software__developer',
+                    ),
+                ),
+            )
+
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "list":
             return AssetListSerializer
 
         return AssetDetailSerializer
 
+    def list(self, request, *args, **kwargs):
+        """Override list to build rows from values() instead of AssetListSerializer"""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+
+        if page is not None:
+            return self.get_paginated_response([asset_list_row(row) for row in page])
+        return Response([asset_list_row(row) for row in queryset])
+
+    @method_decorator(condition(etag_func=asset_detail_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """Override retrieve to answer If-None-Match with 304 before loading the asset"""
+        return super().retrieve(request, *args, **kwargs)
+
     def create(self, request, *args, **kwargs):
         """Override create to add detailed logging for validation errors"""
-        logger.info(f"Creating asset with data: {request.data}")
+        logger.debug("Creating asset with data: %s", request.data)
         serializer = self.get_serializer(data=request.data)
 
         if not serializer.is_valid():
-            logger.error(f"Asset creation failed. Validation errors: {serializer.errors}")
-            logger.error(f"Request data was: {request.data}")
+            logger.error("Asset creation failed. Validation errors: %s", serializer.errors)
+            logger.error("Request data was: %s", request.data)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
-        logger.info(f"Asset created successfully: {serializer.data}")
-        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+        data = serializer.data
+        headers = self.get_success_headers(data)
+        logger.debug("Asset created successfully: %s", data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
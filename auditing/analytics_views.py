@@ -4,29 +4,30 @@ Views for analytics and chart data.
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import Count, Q, Avg, Sum
-from django.db.models.functions import TruncDate
-from assets.models import Asset
+from django.db.models import Count, Q, Avg, Sum, OuterRef, Subquery
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from assets.models import Asset, ComputerDetail
 from users.models import Employee, Department
 from software.models import InstalledSoftware, License, SoftwareCatalog
 from auditing.models import ComplianceWarning
-from datetime import datetime, timedelta
+from datetime import timedelta
 
+# Choice labels used to decorate the grouped counts
+_ASSET_TYPE_LABELS = dict(Asset.AssetTypeChoices.choices)
+_ASSET_STATUS_LABELS = dict(Asset.StatusChoices.choices)
+_WARNING_STATUS_LABELS = dict(ComplianceWarning.StatusChoices.choices)
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def assets_distribution(request):
-    """
-    Get distribution of assets by various dimensions.
-    Returns data suitable for pie/donut charts.
-    """
+
+def _assets_distribution_data():
+    """Build the assets_distribution payload."""
     # By type
     by_type = list(Asset.objects.values('asset_type').annotate(
         count=Count('id')
     ).order_by('-count'))
 
     for item in by_type:
-        item['label'] = dict(Asset.AssetTypeChoices.choices).get(item['asset_type'], item['asset_type'])
+        item['label'] = _ASSET_TYPE_LABELS.get(item['asset_type'], item['asset_type'])
 
     # By status
     by_status = list(Asset.objects.values('status').annotate(
@@ -34,7 +35,7 @@ def assets_distribution(request):
     ).order_by('-count'))
 
     for item in by_status:
-        item['label'] = dict(Asset.StatusChoices.choices).get(item['status'], item['status'])
+        item['label'] = _ASSET_STATUS_LABELS.get(item['status'], item['status'])
 
     # By department (Top 10)
     by_department = list(Asset.objects.filter(
@@ -57,32 +58,30 @@ def assets_distribution(request):
         {'label': '> 32GB', 'min': 32, 'max': 999},
     ]
 
-    ram_distribution = []
-    for range_item in ram_ranges:
-        count = Asset.objects.filter(
-            computerdetail__isnull=False,
-            computerdetail__ram_gb__gte=range_item['min'],
-            computerdetail__ram_gb__lt=range_item['max']
-        ).count()
-        ram_distribution.append({
-            'label': range_item['label'],
-            'count': count
-        })
+    # One conditional aggregate computes every bucket in a single query
+    ram_counts = ComputerDetail.objects.aggregate(**{
+        f'ram_bucket_{i}': Count('pk', filter=Q(
+            ram_gb__gte=range_item['min'],
+            ram_gb__lt=range_item['max']
+        ))
+        for i, range_item in enumerate(ram_ranges)
+    })
 
-    return Response({
+    ram_distribution = [
+        {'label': range_item['label'], 'count': ram_counts[f'ram_bucket_{i}']}
+        for i, range_item in enumerate(ram_ranges)
+    ]
+
+    return {
         'by_type': by_type,
         'by_status': by_status,
         'by_department': by_department,
         'ram_distribution': ram_distribution
-    })
+    }
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def employees_distribution(request):
-    """
-    Get distribution of employees.
-    """
+def _employees_distribution_data():
+    """Build the employees_distribution payload."""
     # By department (Top 10)
     by_department = list(Employee.objects.filter(
         department__isnull=False
@@ -106,25 +105,21 @@ def employees_distribution(request):
         item['label'] = f"{item['assets_count']} assets"
         item['count'] = item['employees']
 
-    return Response({
+    return {
         'by_department': by_department,
         'assets_per_employee': assets_per_employee
-    })
+    }
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def warnings_analytics(request):
-    """
-    Get analytics data for compliance warnings.
-    """
+def _warnings_analytics_data():
+    """Build the warnings_analytics payload."""
     # By status
     by_status = list(ComplianceWarning.objects.values('status').annotate(
         count=Count('id')
     ).order_by('-count'))
 
     for item in by_status:
-        item['label'] = dict(ComplianceWarning.StatusChoices.choices).get(item['status'], item['status'])
+        item['label'] = _WARNING_STATUS_LABELS.get(item['status'], item['status'])
 
     # By category
     by_category = list(ComplianceWarning.objects.values('category').annotate(
@@ -135,7 +130,8 @@ def warnings_analytics(request):
         item['label'] = item['category']
 
     # Trend over last 30 days
-    thirty_days_ago = datetime.now() - timedelta(days=30)
+    now = timezone.now()
+    thirty_days_ago = now - timedelta(days=30)
     trend_data = list(ComplianceWarning.objects.filter(
         detection_date__gte=thirty_days_ago
     ).annotate(
@@ -145,109 +141,117 @@ def warnings_analytics(request):
     ).order_by('date'))
 
     # Fill in missing dates with 0
-    date_range = []
-    current_date = thirty_days_ago.date()
-    end_date = datetime.now().date()
+    trend_counts = {item['date']: item['count'] for item in trend_data}
+    # TruncDate buckets in the current time zone, so the range must too
+    start_date = timezone.localdate(thirty_days_ago)
+    days = (timezone.localdate(now) - start_date).days + 1
 
-    while current_date <= end_date:
-        existing = next((item for item in trend_data if item['date'] == current_date), None)
+    date_range = []
+    for offset in range(days):
+        current_date = start_date + timedelta(days=offset)
         date_range.append({
             'date': current_date.isoformat(),
-            'count': existing['count'] if existing else 0
+            'count': trend_counts.get(current_date, 0)
         })
-        current_date += timedelta(days=1)
 
-    return Response({
+    return {
         'by_status': by_status,
         'by_category': by_category,
         'trend': date_range
-    })
+    }
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def software_analytics(request):
-    """
-    Get analytics data for software.
-    """
-    # Top 10 most installed software
-    top_installed = list(SoftwareCatalog.objects.annotate(
-        installations_count=Count('installations')
-    ).filter(
-        installations_count__gt=0
-    ).values(
-        'name', 'developer', 'installations_count'
-    ).order_by('-installations_count')[:10])
-
-    for item in top_installed:
-        item['label'] = f"{item['name']} ({item['developer']})"
-        item['count'] = item['installations_count']
+def _software_analytics_data():
+    """Build the software_analytics payload."""
+    # Installations and unlicensed installations per software in one grouped
+    # query; both top 10 lists are sliced from the same rows
+    installation_counts = list(InstalledSoftware.objects.values(
+        'software__name', 'software__developer'
+    ).annotate(
+        total=Count('id'),
+        unlicensed=Count('id', filter=Q(license__isnull=True))
+    ))
+
+    top_installed = [
+        {
+            'name': item['software__name'],
+            'developer': item['software__developer'],
+            'installations_count': item['total'],
+            'label': f"{item['software__name']} ({item['software__developer']})",
+            'count': item['total'],
+        }
+        for item in sorted(installation_counts, key=lambda item: -item['total'])[:10]
+    ]
 
     # License usage overview - grouped by software
-    # Get all licenses grouped by software
-    from collections import defaultdict
-
-    licenses = License.objects.select_related('software').prefetch_related('installations').all()
-    software_licenses = defaultdict(lambda: {'total': 0, 'in_use': 0, 'name': '', 'developer': ''})
-
-    for lic in licenses:
-        software_key = lic.software.id
-        in_use = lic.installations.count()
-
-        # Aggregate by software
-        software_licenses[software_key]['name'] = lic.software.name
-        software_licenses[software_key]['developer'] = lic.software.developer
-        software_licenses[software_key]['total'] += lic.quantity
-        software_licenses[software_key]['in_use'] += in_use
-
-    # Convert to list and calculate available
-    license_data = []
-    for data in software_licenses.values():
-        license_data.append({
-            'name': f"{data['name']} ({data['developer']})",
-            'total': data['total'],
-            'in_use': data['in_use'],
-            'available': max(0, data['total'] - data['in_use'])
-        })
-
-    # Sort by total quantity and take top 10
-    license_data = sorted(license_data, key=lambda x: x['total'], reverse=True)[:10]
-
-    # Software without licenses (installations count)
-    software_without_license = InstalledSoftware.objects.filter(
-        license__isnull=True
+    # Totals and usage come from per-software subqueries; joining licenses and
+    # installations directly would multiply quantity by the number of installs
+    licensed_quantity = License.objects.filter(
+        software=OuterRef('pk')
+    ).values('software').annotate(
+        total=Sum('quantity')
+    ).values('total')
+
+    licensed_installations = InstalledSoftware.objects.filter(
+        license__software=OuterRef('pk')
+    ).values('license__software').annotate(
+        in_use=Count('pk')
+    ).values('in_use')
+
+    license_usage = SoftwareCatalog.objects.annotate(
+        total=Subquery(licensed_quantity),
+        in_use=Coalesce(Subquery(licensed_installations), 0)
+    ).filter(
+        total__isnull=False
     ).values(
-        'software__name', 'software__developer'
-    ).annotate(
-        count=Count('id')
-    ).order_by('-count')[:10]
+        'name', 'developer', 'total', 'in_use'
+    ).order_by('-total', 'name')[:10]
+
+    license_data = [
+        {
+            'name': f"{item['name']} ({item['developer']})",
+            'total': item['total'],
+            'in_use': item['in_use'],
+            'available': max(0, item['total'] - item['in_use'])
+        }
+        for item in license_usage
+    ]
 
-    for item in software_without_license:
-        item['label'] = f"{item['software__name']} ({item['software__developer']})"
+    # Software without licenses (installations count)
+    software_without_license = [
+        {
+            'software__name': item['software__name'],
+            'software__developer': item['software__developer'],
+            'count': item['unlicensed'],
+            'label': f"{item['software__name']} ({item['software__developer']})",
+        }
+        for item in sorted(
+            (item for item in installation_counts if item['unlicensed']),
+            key=lambda item: -item['unlicensed']
+        )[:10]
+    ]
 
-    return Response({
+    return {
         'top_installed': top_installed,
         'license_usage': license_data,
-        'without_license': list(software_without_license)
-    })
-
-
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def summary_metrics(request):
-    """
-    Get summary metrics for dashboard overview.
-    """
-    # Total counts
-    total_assets = Asset.objects.count()
+        'without_license': software_without_license
+    }
+
+
+def _summary_metrics_data():
+    """Build the summary_metrics payload."""
+    # Asset counts and average RAM in a single pass over assets; the
+    # computerdetail join is one-to-one so it doesn't inflate the counts
+    asset_stats = Asset.objects.aggregate(
+        total=Count('pk'),
+        assigned=Count('pk', filter=Q(status=Asset.StatusChoices.ASSIGNED)),
+        in_storage=Count('pk', filter=Q(status=Asset.StatusChoices.IN_STORAGE)),
+        in_repair=Count('pk', filter=Q(status=Asset.StatusChoices.IN_REPAIR)),
+        avg_ram=Avg('computerdetail__ram_gb'),
+    )
     total_employees = Employee.objects.count()
     total_departments = Department.objects.count()
 
-    # Assets by status
-    assets_assigned = Asset.objects.filter(status=Asset.StatusChoices.ASSIGNED).count()
-    assets_in_storage = Asset.objects.filter(status=Asset.StatusChoices.IN_STORAGE).count()
-    assets_in_repair = Asset.objects.filter(status=Asset.StatusChoices.IN_REPAIR).count()
-
     # Warnings
     active_warnings = ComplianceWarning.objects.filter(
         status__in=[ComplianceWarning.StatusChoices.NEW, ComplianceWarning.StatusChoices.IN_REVIEW]
@@ -258,18 +262,14 @@ def summary_metrics(request):
     total_licenses = License.objects.count()
     total_installations = InstalledSoftware.objects.count()
 
-    # Compute average RAM
-    avg_ram = Asset.objects.filter(
-        computerdetail__isnull=False,
-        computerdetail__ram_gb__isnull=False
-    ).aggregate(Avg('computerdetail__ram_gb'))['computerdetail__ram_gb__avg']
+    avg_ram = asset_stats['avg_ram']
 
-    return Response({
+    return {
         'assets': {
-            'total': total_assets,
-            'assigned': assets_assigned,
-            'in_storage': assets_in_storage,
-            'in_repair': assets_in_repair,
+            'total': asset_stats['total'],
+            'assigned': asset_stats['assigned'],
+            'in_storage': asset_stats['in_storage'],
+            'in_repair': asset_stats['in_repair'],
         },
         'employees': {
             'total': total_employees,
@@ -288,4 +288,67 @@ def summary_metrics(request):
         'hardware': {
             'avg_ram_gb': round(avg_ram, 2) if avg_ram else 0,
         }
+    }
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def assets_distribution(request):
+    """
+    Get distribution of assets by various dimensions.
+    Returns data suitable for pie/donut charts.
+    """
+    return Response(_assets_distribution_data())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def employees_distribution(request):
+    """
+    Get distribution of employees.
+    """
+    return Response(_employees_distribution_data())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def warnings_analytics(request):
+    """
+    Get analytics data for compliance warnings.
+    """
+    return Response(_warnings_analytics_data())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def software_analytics(request):
+    """
+    Get analytics data for software.
+    """
+    return Response(_software_analytics_data())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def summary_metrics(request):
+    """
+    Get summary metrics for dashboard overview.
+    """
+    return Response(_summary_metrics_data())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def dashboard_bundle(request):
+    """
+    Get every analytics payload in one response.
+    Lets the dashboard load its charts with a single authenticated request
+    instead of five.
+    """
+    return Response({
+        'assets_distribution': _assets_distribution_data(),
+        'employees_distribution': _employees_distribution_data(),
+        'warnings': _warnings_analytics_data(),
+        'software': _software_analytics_data(),
+        'summary': _summary_metrics_data(),
     })
@@ -2,7 +2,9 @@
 Utilities for checking hardware obsolescence.
 """
 from typing import List, Dict, Any
-from assets.models import Asset
+from django.db.models import Exists, F, OuterRef, Prefetch, Q
+from django.db.models.functions import NullIf
+from assets.models import Asset, StorageDevice, os_version_parts
 from .models import HardwareObsolescenceRules
 
 
@@ -25,6 +27,11 @@ def check_asset_obsolescence(asset: Asset, rules: HardwareObsolescenceRules) ->
     """
     Check if an asset meets obsolescence criteria.
 
+    Callers checking many assets should select_related('computerdetail') and
+    prefetch_related('storage_devices'), otherwise each asset costs extra
+    queries. If the asset carries a low_storage_devices list (see
+    get_obsolete_assets), only those disks are checked.
+
     Returns:
         dict with keys:
             - is_obsolete: bool
@@ -50,15 +57,14 @@ def check_asset_obsolescence(asset: Asset, rules: HardwareObsolescenceRules) ->
     details = {}
 
     # Check if computer detail exists
-    if not hasattr(asset, 'computerdetail'):
+    computer = getattr(asset, 'computerdetail', None)
+    if computer is None:
         return {
             'is_obsolete': False,
             'reasons': ['Sin datos de hardware'],
             'details': {}
         }
 
-    computer = asset.computerdetail
-
     # Check Windows version
     if computer.os_name and 'Windows' in computer.os_name:
         current_version = parse_windows_version(computer.os_version)
@@ -77,7 +83,9 @@ def check_asset_obsolescence(asset: Asset, rules: HardwareObsolescenceRules) ->
             details['ram_min_required'] = rules.ram_min_gb
 
     # Check disk space (any disk below threshold)
-    storage_devices = asset.storage_devices.all()
+    storage_devices = getattr(asset, 'low_storage_devices', None)
+    if storage_devices is None:
+        storage_devices = asset.storage_devices.all()
     for disk in storage_devices:
         if disk.capacity_gb and disk.free_space_gb is not None:
             free_percent = (disk.free_space_gb / disk.capacity_gb) * 100
@@ -113,10 +121,39 @@ def get_obsolete_assets() -> List[Dict[str, Any]]:
     if not rules.enabled:
         return []
 
-    # Get all computers (NOTEBOOK and DESKTOP)
+    # Same arithmetic as check_asset_obsolescence so both agree at the threshold
+    low_disks = StorageDevice.objects.annotate(
+        free_percent=F('free_space_gb') / NullIf(F('capacity_gb'), 0.0) * 100.0
+    ).filter(
+        free_percent__lt=rules.disk_min_free_percent,
+    )
+
+    # Compare the parsed version columns; <= on the build keeps versions with
+    # a fourth part (10.0.19041.1) as candidates for the exact check below
+    major, minor, build = os_version_parts(rules.windows_min_version)
+    old_windows = Q(computerdetail__os_name__contains='Windows') & (
+        Q(computerdetail__os_major__lt=major)
+        | Q(computerdetail__os_major=major, computerdetail__os_minor__lt=minor)
+        | Q(computerdetail__os_major=major, computerdetail__os_minor=minor, computerdetail__os_build__lte=build)
+    )
+
+    # Narrow down in SQL to computers that may fail a rule; the per-asset
+    # check below confirms each one and builds its reasons
+    candidates = (
+        Q(computerdetail__ram_gb__lt=rules.ram_min_gb)
+        | old_windows
+        | Exists(low_disks.filter(asset=OuterRef('pk')))
+    )
+
+    # Get candidate computers (NOTEBOOK and DESKTOP)
     assets = Asset.objects.filter(
-        asset_type__in=['NOTEBOOK', 'DESKTOP']
-    ).select_related('computerdetail', 'department', 'employee').prefetch_related('storage_devices')
+        candidates,
+        asset_type__in=['NOTEBOOK', 'DESKTOP'],
+        computerdetail__isnull=False,
+    ).select_related('computerdetail', 'department', 'employee').prefetch_related(
+        # Only disks below the threshold can add reasons, skip loading the rest
+        Prefetch('storage_devices', queryset=low_disks, to_attr='low_storage_devices')
+    )
 
     obsolete_list = []
 
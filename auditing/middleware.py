@@ -1,19 +1,22 @@
 """
 Middleware to capture current request for audit logging.
 
-This middleware stores the entire request in thread-local storage
+This middleware stores the entire request in a context variable
 so that signals can access request.user even when DRF authenticates
-inside the view.
+inside the view. Audit entries created during the request are buffered
+and written with a single bulk insert when it finishes.
 """
 import logging
-from .signals import set_current_request, clear_current_request
+from .signals import (
+    set_current_request, clear_current_request, start_audit_buffer, flush_audit_buffer
+)
 
 logger = logging.getLogger(__name__)
 
 
 class AuditLogMiddleware:
     """
-    Middleware that stores the current request in thread-local storage.
+    Middleware that stores the current request in a context variable.
 
     This allows signals to access the authenticated user from request.user,
     even when using DRF's JWT authentication which happens inside the view.
@@ -25,23 +28,30 @@ class AuditLogMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        # Store the entire request object in thread-local
+        # Store the entire request object for the current context
         # This way signals can access request.user during .save()
-        set_current_request(request)
-        logger.info(f"[AUDIT MIDDLEWARE] Stored request for {request.method} {request.path}")
+        token = set_current_request(request)
+        buffer_token = start_audit_buffer()
+        logger.info("[AUDIT MIDDLEWARE] Stored request for %s %s", request.method, request.path)
 
         try:
             # Process the request - DRF will authenticate inside the view
             response = self.get_response(request)
 
-            # Log if user was authenticated (for debugging)
-            if hasattr(request, 'user') and request.user.is_authenticated:
-                logger.info(f"[AUDIT MIDDLEWARE] Request completed with user: {request.user.username} (ID: {request.user.id})")
-            else:
-                logger.debug(f"[AUDIT MIDDLEWARE] Request completed without authenticated user")
+            # Log if user was authenticated (for debugging); request.user is
+            # lazy, so only resolve it when the line would be emitted
+            if logger.isEnabledFor(logging.INFO):
+                if hasattr(request, 'user') and request.user.is_authenticated:
+                    logger.info(
+                        "[AUDIT MIDDLEWARE] Request completed with user: %s (ID: %s)",
+                        request.user.username, request.user.id
+                    )
+                else:
+                    logger.debug("[AUDIT MIDDLEWARE] Request completed without authenticated user")
 
             return response
         finally:
-            # Always clear the request after processing
-            clear_current_request()
-            logger.debug(f"[AUDIT MIDDLEWARE] Cleared request")
+            # Always write the buffered audit entries and clear the request
+            flush_audit_buffer(buffer_token)
+            clear_current_request(token)
+            logger.debug("[AUDIT MIDDLEWARE] Cleared request")
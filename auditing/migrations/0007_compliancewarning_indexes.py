@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auditing", "0006_alter_compliancewarning_detection_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="compliancewarning",
+            index=models.Index(fields=["status"], name="warning_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="compliancewarning",
+            index=models.Index(fields=["category"], name="warning_category_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="compliancewarning",
+            index=models.Index(fields=["detection_date"], name="warning_detection_date_idx"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+import auditing.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auditing", "0007_compliancewarning_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="assetcheckin",
+            name="unique_token",
+            field=models.CharField(
+                db_index=True,
+                default=auditing.models.generate_unique_token,
+                max_length=64,
+                unique=True,
+            ),
+        ),
+    ]
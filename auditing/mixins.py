@@ -0,0 +1,17 @@
+"""
+Model mixins used by the audit signals.
+"""
+
+
+class AuditedModelMixin:
+    """
+    Remember the field values an instance was loaded with, so the audit
+    signals can diff an update without reading the row again in pre_save.
+    The snapshot maps each loaded attname (e.g. 'department_id') to its value.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._audit_initial = dict(zip(field_names, values))
+        return instance
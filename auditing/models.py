@@ -3,11 +3,18 @@ from django.db import models
 from django.utils import timezone
 from assets.models import Asset
 from users.models import Employee
+from .mixins import AuditedModelMixin
 import secrets
 
 
+def generate_unique_token():
+    """Generate a cryptographically secure unique token"""
+    return secrets.token_urlsafe(32)
+
+
 class AuditLog(models.Model):
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the entry is created, buffered entries are inserted later
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     system_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -34,7 +41,9 @@ class AssetCheckin(models.Model):
     employee = models.ForeignKey(
         Employee, on_delete=models.PROTECT, related_name="checkins"
     )
-    unique_token = models.CharField(max_length=64, unique=True, db_index=True, default='')
+    unique_token = models.CharField(
+        max_length=64, unique=True, db_index=True, default=generate_unique_token
+    )
     status = models.CharField(
         max_length=20,
         choices=StatusChoices.choices,
@@ -52,19 +61,8 @@ class AssetCheckin(models.Model):
     def __str__(self):
         return f"Check-in de {self.asset.inventory_code} por {self.employee} - {self.get_status_display()}"
 
-    @staticmethod
-    def generate_unique_token():
-        """Generate a cryptographically secure unique token"""
-        return secrets.token_urlsafe(32)
-
-    def save(self, *args, **kwargs):
-        """Override save to generate token if not present"""
-        if not self.unique_token:
-            self.unique_token = self.generate_unique_token()
-        super().save(*args, **kwargs)
 
-
-class ComplianceWarning(models.Model):
+class ComplianceWarning(AuditedModelMixin, models.Model):
     class StatusChoices(models.TextChoices):
         NEW = "NUEVA", "Nueva"
         IN_REVIEW = "EN_REVISION", "En Revisión"
@@ -90,6 +88,14 @@ class ComplianceWarning(models.Model):
     )
     resolution_notes = models.TextField(blank=True)
 
+    class Meta:
+        # Back the analytics GROUP BYs and the 30-day trend range filter
+        indexes = [
+            models.Index(fields=["status"], name="warning_status_idx"),
+            models.Index(fields=["category"], name="warning_category_idx"),
+            models.Index(fields=["detection_date"], name="warning_detection_date_idx"),
+        ]
+
     def __str__(self):
         return f"Alerta de {self.category} en {self.asset.inventory_code}"
 
@@ -18,4 +18,5 @@ urlpatterns = [
     path('analytics/warnings/', analytics_views.warnings_analytics, name='analytics-warnings'),
     path('analytics/software/', analytics_views.software_analytics, name='analytics-software'),
     path('analytics/summary/', analytics_views.summary_metrics, name='analytics-summary'),
+    path('analytics/all/', analytics_views.dashboard_bundle, name='analytics-all'),
 ]
@@ -1,16 +1,123 @@
 """
 Views for generating reports and analytics data.
 """
+import orjson
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Count, Q, Avg
+from rest_framework.utils.encoders import JSONEncoder
+from django.db.models import Count, Q, Avg, Case, When, Value, F, CharField, Exists, OuterRef, Prefetch
+from django.db.models.functions import Concat, Length, Right
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from assets.models import Asset
 from users.models import Employee, Department
 from software.models import InstalledSoftware, License, SoftwareCatalog
 from auditing.models import ComplianceWarning
 from datetime import datetime, timedelta
+from itertools import islice
+from sigat.renderers import ORJSONRenderer
+
+# Choice labels, looked up directly instead of per-row get_*_display() calls
+_ASSET_TYPE_LABELS = dict(Asset.AssetTypeChoices.choices)
+_ASSET_STATUS_LABELS = dict(Asset.StatusChoices.choices)
+_WARNING_STATUS_LABELS = dict(ComplianceWarning.StatusChoices.choices)
+
+# Rows fetched per database round trip while a report streams
+_REPORT_CHUNK_SIZE = 2000
+
+_encode_default = JSONEncoder().default
+
+# Same options as the API's renderer, so streamed rows format values
+# (datetimes in particular) exactly like a regular response
+_ENCODE_OPTIONS = ORJSONRenderer.options
+
+
+def _stream_report(request, rows, to_row):
+    """
+    Stream a report as {"results": [...], "count": N}.
+    Rows are encoded one at a time as they come off the iterator, so memory
+    stays bounded by the chunk size rather than the report size. The count
+    is written last, once every row has been seen.
+
+    Only JSON is streamed. Other renderers (?format=api, the browsable API)
+    get a regular DRF Response with the same body.
+    """
+    if request.accepted_renderer.format != 'json':
+        results = [to_row(row) for row in rows]
+        return Response({'results': results, 'count': len(results)})
+
+    # Run the query and encode the first chunk before returning, so a
+    # failing query or row is still a normal error response. A failure
+    # further down leaves the body truncated (invalid JSON), never complete.
+    rows = iter(rows)
+    head = [
+        orjson.dumps(to_row(row), default=_encode_default, option=_ENCODE_OPTIONS)
+        for row in islice(rows, _REPORT_CHUNK_SIZE)
+    ]
+
+    def generate():
+        count = len(head)
+        yield b'{"results":[' + b','.join(head)
+        for row in rows:
+            encoded = orjson.dumps(to_row(row), default=_encode_default, option=_ENCODE_OPTIONS)
+            yield encoded if count == 0 else b',' + encoded
+            count += 1
+        yield b'],"count":%d}' % count
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
+
+
+class ReportPagination(CursorPagination):
+    """
+    Opt-in keyset pagination for reports.
+    Pages are keyset ranges over the ordering field, so deep pages cost the
+    same as the first one. Follow the next/previous links.
+    """
+    page_size = 200
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    ordering = '-id'
+
+
+def _report_response(request, queryset, to_row, ordering='-id'):
+    """
+    Return one cursor page when the client asks for one (?page_size= or
+    ?cursor=), otherwise stream the whole report for exports.
+    """
+    params = request.query_params
+    if ReportPagination.cursor_query_param in params or ReportPagination.page_size_query_param in params:
+        paginator = ReportPagination()
+        paginator.ordering = ordering
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response([to_row(obj) for obj in page])
+    return _stream_report(request, queryset.iterator(chunk_size=_REPORT_CHUNK_SIZE), to_row)
+
+
+def _employee_name(employee):
+    """
+    SQL expression for "<first> <last>" of the employee at the given relation
+    path, or 'Sin asignar' when there is none.
+    """
+    return Case(
+        When(**{f'{employee}__isnull': True}, then=Value('Sin asignar')),
+        default=Concat(f'{employee}__first_name', Value(' '), f'{employee}__last_name'),
+        output_field=CharField(),
+    )
+
+
+def _parse_datetime_param(value):
+    """
+    Parse a YYYY-MM-DD (or full ISO) query param into an aware datetime.
+    Naive values are read in the current time zone, as the ORM would.
+    Raises ValueError on malformed input.
+    """
+    parsed = datetime.fromisoformat(value)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
 
 
 @api_view(['GET'])
@@ -26,29 +133,45 @@ def employees_with_assets_report(request):
     department_id = request.query_params.get('department')
     has_assets = request.query_params.get('has_assets')
 
-    employees = Employee.objects.select_related('department').prefetch_related('assets')
+    # Load only the employee and asset columns the report renders
+    employees = Employee.objects.select_related('department').only(
+        'rut', 'first_name', 'last_name', 'email', 'position', 'department__name'
+    )
 
     if department_id:
         employees = employees.filter(department_id=department_id)
 
+    # EXISTS avoids joining every asset row and de-duplicating with DISTINCT
+    employee_assets = Asset.objects.filter(employee=OuterRef('pk'))
     if has_assets == 'true':
-        employees = employees.filter(assets__isnull=False).distinct()
+        employees = employees.filter(Exists(employee_assets))
     elif has_assets == 'false':
-        employees = employees.filter(assets__isnull=True)
+        employees = employees.filter(~Exists(employee_assets))
+
+    # Employees without assets have nothing to prefetch
+    with_assets = has_assets != 'false'
+    if with_assets:
+        employees = employees.prefetch_related(
+            Prefetch(
+                'assets',
+                queryset=Asset.objects.only(
+                    'employee_id', 'inventory_code', 'asset_type', 'brand', 'model', 'status'
+                )
+            )
+        )
 
-    data = []
-    for emp in employees:
+    def to_row(emp):
         assets_list = []
-        for asset in emp.assets.all():
+        for asset in (emp.assets.all() if with_assets else ()):
             assets_list.append({
                 'inventory_code': asset.inventory_code,
-                'asset_type': asset.get_asset_type_display(),
+                'asset_type': _ASSET_TYPE_LABELS.get(asset.asset_type, asset.asset_type),
                 'brand': asset.brand,
                 'model': asset.model,
-                'status': asset.get_status_display(),
+                'status': _ASSET_STATUS_LABELS.get(asset.status, asset.status),
             })
 
-        data.append({
+        return {
             'rut': emp.rut,
             'name': f"{emp.first_name} {emp.last_name}",
             'email': emp.email,
@@ -56,12 +179,9 @@ def employees_with_assets_report(request):
             'department': emp.department.name if emp.department else 'Sin departamento',
             'assets_count': len(assets_list),
             'assets': assets_list,
-        })
+        }
 
-    return Response({
-        'count': len(data),
-        'results': data
-    })
+    return _report_response(request, employees, to_row)
 
 
 @api_view(['GET'])
@@ -85,9 +205,7 @@ def assets_by_specs_report(request):
     department_id = request.query_params.get('department')
     has_employee = request.query_params.get('has_employee')
 
-    assets = Asset.objects.select_related(
-        'employee', 'department', 'computerdetail'
-    ).prefetch_related('storage_devices', 'graphics_cards')
+    assets = Asset.objects.all()
 
     # Apply filters
     if asset_type:
@@ -104,44 +222,46 @@ def assets_by_specs_report(request):
     elif has_employee == 'false':
         assets = assets.filter(employee__isnull=True)
 
-    # RAM filters (requires computerdetail)
+    # RAM filters; the comparison already excludes assets without details
     if ram_max:
-        assets = assets.filter(
-            computerdetail__isnull=False,
-            computerdetail__ram_gb__lte=float(ram_max)
-        )
+        assets = assets.filter(computerdetail__ram_gb__lte=float(ram_max))
 
     if ram_min:
-        assets = assets.filter(
-            computerdetail__isnull=False,
-            computerdetail__ram_gb__gte=float(ram_min)
-        )
+        assets = assets.filter(computerdetail__ram_gb__gte=float(ram_min))
+
+    # Read the rendered columns as plain dicts; computer details come from the
+    # same LEFT JOIN, so missing ones are just NULL columns
+    rows = assets.annotate(
+        employee_name=_employee_name('employee')
+    ).values(
+        'id', 'inventory_code', 'serial_number', 'asset_type', 'brand', 'model',
+        'status', 'acquisition_date', 'employee', 'employee_name', 'employee__email',
+        'department__name', 'computerdetail',
+        'computerdetail__ram_gb', 'computerdetail__cpu_model',
+        'computerdetail__os_name', 'computerdetail__os_version',
+    )
 
-    data = []
-    for asset in assets:
-        computer_detail = getattr(asset, 'computerdetail', None)
-
-        data.append({
-            'inventory_code': asset.inventory_code,
-            'serial_number': asset.serial_number,
-            'asset_type': asset.get_asset_type_display(),
-            'brand': asset.brand,
-            'model': asset.model,
-            'status': asset.get_status_display(),
-            'acquisition_date': asset.acquisition_date,
-            'employee': f"{asset.employee.first_name} {asset.employee.last_name}" if asset.employee else 'Sin asignar',
-            'employee_email': asset.employee.email if asset.employee else '',
-            'department': asset.department.name if asset.department else 'Sin departamento',
-            'ram_gb': computer_detail.ram_gb if computer_detail else None,
-            'cpu_model': computer_detail.cpu_model if computer_detail else '',
-            'os_name': computer_detail.os_name if computer_detail else '',
-            'os_version': computer_detail.os_version if computer_detail else '',
-        })
-
-    return Response({
-        'count': len(data),
-        'results': data
-    })
+    def to_row(row):
+        has_detail = row['computerdetail'] is not None
+
+        return {
+            'inventory_code': row['inventory_code'],
+            'serial_number': row['serial_number'],
+            'asset_type': _ASSET_TYPE_LABELS.get(row['asset_type'], row['asset_type']),
+            'brand': row['brand'],
+            'model': row['model'],
+            'status': _ASSET_STATUS_LABELS.get(row['status'], row['status']),
+            'acquisition_date': row['acquisition_date'],
+            'employee': row['employee_name'],
+            'employee_email': row['employee__email'] if row['employee'] else '',
+            'department': row['department__name'] or 'Sin departamento',
+            'ram_gb': row['computerdetail__ram_gb'],
+            'cpu_model': row['computerdetail__cpu_model'] if has_detail else '',
+            'os_name': row['computerdetail__os_name'] if has_detail else '',
+            'os_version': row['computerdetail__os_version'] if has_detail else '',
+        }
+
+    return _report_response(request, rows, to_row)
 
 
 @api_view(['GET'])
@@ -154,14 +274,16 @@ def software_installations_report(request):
     - software_id: Filter by specific software
     - has_license: true/false - installations with/without license
     - department: Filter by department of the asset
+
+    Grouping:
+    - group_by=software: one row per software with installation counts
     """
     software_id = request.query_params.get('software_id')
     has_license = request.query_params.get('has_license')
     department_id = request.query_params.get('department')
+    group_by = request.query_params.get('group_by')
 
-    installations = InstalledSoftware.objects.select_related(
-        'software', 'asset', 'asset__employee', 'asset__department', 'license'
-    )
+    installations = InstalledSoftware.objects.all()
 
     if software_id:
         installations = installations.filter(software_id=software_id)
@@ -174,25 +296,52 @@ def software_installations_report(request):
     if department_id:
         installations = installations.filter(asset__department_id=department_id)
 
-    data = []
-    for inst in installations:
-        data.append({
-            'software_name': inst.software.name,
-            'software_developer': inst.software.developer,
-            'version': inst.version or 'N/A',
-            'install_date': inst.install_date,
-            'asset_code': inst.asset.inventory_code,
-            'asset_type': inst.asset.get_asset_type_display(),
-            'employee': f"{inst.asset.employee.first_name} {inst.asset.employee.last_name}" if inst.asset.employee else 'Sin asignar',
-            'department': inst.asset.department.name if inst.asset.department else 'Sin departamento',
-            'has_license': inst.license is not None,
-            'license_key': inst.license.license_key[-4:] if inst.license and inst.license.license_key else '',
-        })
-
-    return Response({
-        'count': len(data),
-        'results': data
-    })
+    if group_by == 'software':
+        # Counted by the database; one row per software instead of per install
+        grouped = installations.values(
+            'software__name', 'software__developer'
+        ).annotate(
+            installations=Count('id'),
+            with_license=Count('license'),
+        ).order_by('-installations', 'software__name')
+
+        def to_group_row(row):
+            return {
+                'software_name': row['software__name'],
+                'software_developer': row['software__developer'],
+                'installations': row['installations'],
+                'with_license': row['with_license'],
+                'without_license': row['installations'] - row['with_license'],
+            }
+
+        return _stream_report(request, grouped.iterator(chunk_size=_REPORT_CHUNK_SIZE), to_group_row)
+
+    # Read the rendered columns as plain dicts; only the key's tail is loaded
+    rows = installations.annotate(
+        license_key_suffix=Right('license__license_key', 4),
+        employee_name=_employee_name('asset__employee'),
+    ).values(
+        'id', 'version', 'install_date', 'license', 'license_key_suffix',
+        'software__name', 'software__developer',
+        'asset__inventory_code', 'asset__asset_type', 'employee_name',
+        'asset__department__name',
+    )
+
+    def to_row(row):
+        return {
+            'software_name': row['software__name'],
+            'software_developer': row['software__developer'],
+            'version': row['version'] or 'N/A',
+            'install_date': row['install_date'],
+            'asset_code': row['asset__inventory_code'],
+            'asset_type': _ASSET_TYPE_LABELS.get(row['asset__asset_type'], row['asset__asset_type']),
+            'employee': row['employee_name'],
+            'department': row['asset__department__name'] or 'Sin departamento',
+            'has_license': row['license'] is not None,
+            'license_key': row['license_key_suffix'] or '',
+        }
+
+    return _report_response(request, rows, to_row)
 
 
 @api_view(['GET'])
@@ -208,46 +357,53 @@ def licenses_usage_report(request):
     software_id = request.query_params.get('software_id')
     usage_status = request.query_params.get('status')
 
-    licenses = License.objects.select_related('software').prefetch_related('installations')
+    # Count installations in SQL and load only the columns the report renders
+    licenses = License.objects.select_related('software').annotate(
+        in_use=Count('installations')
+    ).annotate(
+        status_label=Case(
+            When(in_use__gt=F('quantity'), then=Value('exceeded')),
+            When(in_use=F('quantity'), then=Value('full')),
+            default=Value('available'),
+            output_field=CharField(),
+        ),
+        # Only the masked tail of the key is shown, so the key itself is never loaded
+        key_length=Length('license_key'),
+    ).annotate(
+        key_suffix=Case(
+            When(key_length__gt=4, then=Right('license_key', 4)),
+            default=None,
+        )
+    ).only(
+        'quantity', 'purchase_date', 'expiration_date',
+        'software', 'software__name', 'software__developer'
+    )
 
     if software_id:
         licenses = licenses.filter(software_id=software_id)
 
-    data = []
-    for lic in licenses:
-        in_use = lic.installations.count()
+    if usage_status:
+        licenses = licenses.filter(status_label=usage_status)
+
+    def to_row(lic):
+        in_use = lic.in_use
         available = lic.quantity - in_use
         usage_percentage = (in_use / lic.quantity * 100) if lic.quantity > 0 else 0
 
-        # Determine status
-        if in_use > lic.quantity:
-            status_label = 'exceeded'
-        elif in_use == lic.quantity:
-            status_label = 'full'
-        else:
-            status_label = 'available'
-
-        # Apply status filter
-        if usage_status and status_label != usage_status:
-            continue
-
-        data.append({
+        return {
             'software_name': lic.software.name,
             'software_developer': lic.software.developer,
-            'license_key_display': f"****-****-****-{lic.license_key[-4:]}" if lic.license_key and len(lic.license_key) > 4 else 'Sin clave',
+            'license_key_display': f"****-****-****-{lic.key_suffix}" if lic.key_suffix else 'Sin clave',
             'quantity': lic.quantity,
             'in_use': in_use,
             'available': available,
             'usage_percentage': round(usage_percentage, 1),
             'purchase_date': lic.purchase_date,
             'expiration_date': lic.expiration_date,
-            'status': status_label,
-        })
+            'status': lic.status_label,
+        }
 
-    return Response({
-        'count': len(data),
-        'results': data
-    })
+    return _report_response(request, licenses, to_row)
 
 
 @api_view(['GET'])
@@ -269,9 +425,17 @@ def warnings_report(request):
     date_to = request.query_params.get('date_to')
     department_id = request.query_params.get('department')
 
-    warnings = ComplianceWarning.objects.select_related(
-        'asset', 'asset__employee', 'asset__department', 'resolved_by'
-    )
+    # Parse the date bounds once and reject bad input before building SQL
+    try:
+        date_from = _parse_datetime_param(date_from) if date_from else None
+        date_to = _parse_datetime_param(date_to) if date_to else None
+    except ValueError:
+        return Response(
+            {'error': 'date_from y date_to deben tener el formato YYYY-MM-DD'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    warnings = ComplianceWarning.objects.all()
 
     if warning_status:
         warnings = warnings.filter(status=warning_status)
@@ -288,23 +452,28 @@ def warnings_report(request):
     if department_id:
         warnings = warnings.filter(asset__department_id=department_id)
 
-    data = []
-    for warning in warnings:
-        data.append({
-            'id': warning.id,
-            'asset_code': warning.asset.inventory_code,
-            'asset_type': warning.asset.get_asset_type_display(),
-            'employee': f"{warning.asset.employee.first_name} {warning.asset.employee.last_name}" if warning.asset.employee else 'Sin asignar',
-            'department': warning.asset.department.name if warning.asset.department else 'Sin departamento',
-            'category': warning.category,
-            'description': warning.description,
-            'detection_date': warning.detection_date,
-            'status': warning.get_status_display(),
-            'resolved_by': warning.resolved_by.username if warning.resolved_by else '',
-            'resolution_notes': warning.resolution_notes,
-        })
-
-    return Response({
-        'count': len(data),
-        'results': data
-    })
+    # Read the rendered columns as plain dicts; no model instances needed
+    rows = warnings.annotate(
+        employee_name=_employee_name('asset__employee')
+    ).values(
+        'id', 'category', 'description', 'detection_date', 'status', 'resolution_notes',
+        'asset__inventory_code', 'asset__asset_type', 'employee_name',
+        'asset__department__name', 'resolved_by__username',
+    )
+
+    def to_row(row):
+        return {
+            'id': row['id'],
+            'asset_code': row['asset__inventory_code'],
+            'asset_type': _ASSET_TYPE_LABELS.get(row['asset__asset_type'], row['asset__asset_type']),
+            'employee': row['employee_name'],
+            'department': row['asset__department__name'] or 'Sin departamento',
+            'category': row['category'],
+            'description': row['description'],
+            'detection_date': row['detection_date'],
+            'status': _WARNING_STATUS_LABELS.get(row['status'], row['status']),
+            'resolved_by': row['resolved_by__username'] or '',
+            'resolution_notes': row['resolution_notes'],
+        }
+
+    return _report_response(request, rows, to_row, ordering='-detection_date')
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from rest_framework import serializers
 from .models import AssetCheckin, ComplianceWarning, AuditLog, HardwareObsolescenceRules
 from assets.models import Asset
@@ -182,6 +183,71 @@ class AgentSoftwareSerializer(serializers.Serializer):
     version = serializers.CharField(max_length=100, required=False, allow_blank=True)
 
 
+class AgentSoftwareListField(serializers.ListField):
+    """
+    List of installed software from the agent.
+
+    Reports carry hundreds of entries, so each one is checked with plain dict
+    lookups instead of running AgentSoftwareSerializer per item. The child
+    serializer is kept for the schema and describes the same rules; errors
+    use the same messages and {index: {field: [...]}} shape.
+    """
+    # field name -> (max_length, required)
+    item_fields = {
+        'nombre': (255, True),
+        'desarrollador': (255, False),
+        'version': (100, False),
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, (str, Mapping)) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        items = []
+        errors = {}
+        for index, item in enumerate(data):
+            item_errors, value = self.validate_item(item)
+            if item_errors:
+                errors[index] = item_errors
+            else:
+                items.append(value)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return items
+
+    def validate_item(self, item):
+        """Return (errors, validated dict) for one software entry."""
+        if not isinstance(item, Mapping):
+            return {'non_field_errors': [
+                f'Invalid data. Expected a dictionary, but got {type(item).__name__}.'
+            ]}, None
+
+        errors = {}
+        value = {}
+        for name, (max_length, required) in self.item_fields.items():
+            if name not in item:
+                if required:
+                    errors[name] = ['This field is required.']
+                continue
+            raw = item[name]
+            if raw is None:
+                errors[name] = ['This field may not be null.']
+                continue
+            if isinstance(raw, bool) or not isinstance(raw, (str, int, float)):
+                errors[name] = ['Not a valid string.']
+                continue
+            text = str(raw).strip()
+            if not text and required:
+                errors[name] = ['This field may not be blank.']
+            elif len(text) > max_length:
+                errors[name] = [f'Ensure this field has no more than {max_length} characters.']
+            else:
+                value[name] = text
+        return errors, value
+
+
 class AgentSuspiciousSoftwareSerializer(serializers.Serializer):
     """Serializer for suspicious/illegal software detected by agent"""
     nombre = serializers.CharField(max_length=255, help_text="Software name")
@@ -233,7 +299,7 @@ class AgentHardwareReportSerializer(serializers.Serializer):
     """
     sistema_operativo = AgentOSSerializer()
     hardware = AgentHardwareSerializer()
-    software_instalado = serializers.ListField(
+    software_instalado = AgentSoftwareListField(
         child=AgentSoftwareSerializer(),
         required=False,
         allow_empty=True
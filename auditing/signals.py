@@ -5,101 +5,253 @@ This module captures all CREATE, UPDATE, and DELETE operations on critical model
 and automatically creates AuditLog entries.
 """
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, time
+from functools import lru_cache
+from django.db import transaction
 from django.db.models.signals import post_save, pre_save, pre_delete
-from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from threading import local
+from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for current request
-_thread_locals = local()
+# Current request, kept in a context variable so it follows async tasks too
+_current_request = ContextVar('current_request', default=None)
 
+# Audit entries collected during a request, written together at its end
+_audit_buffer = ContextVar('audit_buffer', default=None)
+
+# Set inside audit_disabled() to skip writing audit entries
+_audit_disabled = ContextVar('audit_disabled', default=False)
 
 def get_current_user():
-    """Get the current user from the stored request in thread-local storage."""
-    request = getattr(_thread_locals, 'request', None)
+    """Get the current user from the stored request."""
+    request = _current_request.get()
 
     if request is None:
-        logger.debug(f"[AUDIT SIGNALS] No request in thread-local")
         return None
 
     if not hasattr(request, 'user'):
-        logger.debug(f"[AUDIT SIGNALS] Request has no user attribute")
         return None
 
-    user = request.user if request.user.is_authenticated else None
-    logger.info(f"[AUDIT SIGNALS] get_current_user() from request returning: {user}")
-    return user
+    return request.user if request.user.is_authenticated else None
 
 
 def set_current_request(request):
-    """Set the current request in thread-local storage."""
-    _thread_locals.request = request
-    logger.debug(f"[AUDIT SIGNALS] set_current_request() called for {request.method} {request.path}")
+    """
+    Set the current request.
+    Returns a token that clear_current_request can use to restore the
+    previous value.
+    """
+    logger.debug("[AUDIT SIGNALS] set_current_request() called for %s %s", request.method, request.path)
+    return _current_request.set(request)
 
 
-def clear_current_request():
-    """Clear the current request from thread-local storage."""
-    if hasattr(_thread_locals, 'request'):
-        logger.debug(f"[AUDIT SIGNALS] Clearing current request")
-        delattr(_thread_locals, 'request')
+def clear_current_request(token=None):
+    """Clear the current request, restoring the value before token if given."""
+    logger.debug("[AUDIT SIGNALS] Clearing current request")
+    if token is not None:
+        _current_request.reset(token)
+    else:
+        _current_request.set(None)
 
 
-def save_old_instance(instance):
+@contextmanager
+def audit_disabled():
+    """Don't write audit entries for the saves and deletes inside this block."""
+    token = _audit_disabled.set(True)
+    try:
+        yield
+    finally:
+        _audit_disabled.reset(token)
+
+
+def auditing_active():
+    """Whether saves are audited right now: an authenticated user and not audit_disabled()."""
+    return not _audit_disabled.get() and get_current_user() is not None
+
+
+def start_audit_buffer():
     """
-    Save the old state of an instance before it's updated.
-    Used in pre_save signals to capture what's about to change.
+    Start collecting audit entries for the current request instead of
+    inserting them one by one. Returns a token for flush_audit_buffer.
     """
-    key = f"old_instance_{instance.__class__.__name__}_{instance.pk}"
+    return _audit_buffer.set([])
+
+
+def stop_audit_buffer(token):
+    """Stop collecting audit entries and return the ones collected so far."""
+    entries = _audit_buffer.get()
+    _audit_buffer.reset(token)
+    return entries or []
+
+
+def write_audit_entries(entries):
+    """Write audit entries in one bulk insert, merging repeated updates first."""
+    if not entries:
+        return
+
+    try:
+        AuditLog.objects.bulk_create(
+            [AuditLog(**entry) for entry in squash_audit_entries(entries)],
+            batch_size=500
+        )
+        logger.info("[AUDIT SIGNALS] ✓ %d buffered audit entries written", len(entries))
+    except Exception as e:
+        logger.error("[AUDIT SIGNALS] ✗ Failed to write buffered audit logs: %s", e, exc_info=True)
+
 
-    # Only save if this is an update (pk exists)
-    if instance.pk:
-        try:
-            old_instance = instance.__class__.objects.get(pk=instance.pk)
-            _thread_locals.__dict__[key] = old_instance
-            logger.debug(f"[AUDIT SIGNALS] Saved old instance for {instance.__class__.__name__} pk={instance.pk}")
-        except instance.__class__.DoesNotExist:
-            logger.debug(f"[AUDIT SIGNALS] No old instance found for {instance.__class__.__name__} pk={instance.pk}")
+def flush_audit_buffer(token):
+    """Write the collected audit entries in one bulk insert and stop collecting."""
+    write_audit_entries(stop_audit_buffer(token))
 
 
-def get_instance_changes(instance):
+def squash_audit_entries(entries):
     """
-    Get the changes between the old instance (saved in pre_save) and current instance.
-    Returns a dict of {field_name: {'old': old_value, 'new': new_value}}
+    Merge repeated UPDATE entries for the same row into one.
+    Each changed field keeps its first 'old' and its last 'new' value; other
+    entries are kept as they are, in order.
     """
-    key = f"old_instance_{instance.__class__.__name__}_{instance.pk}"
-    old_instance = _thread_locals.__dict__.get(key)
+    merged = {}
+    for entry in entries:
+        if entry['action'] != 'UPDATE':
+            merged[id(entry)] = entry
+            continue
+
+        key = (entry['target_table'], entry['target_id'], entry['action'])
+        previous = merged.get(key)
+        if previous is None:
+            merged[key] = entry
+            continue
+
+        details = {**previous['details'], **entry['details']}
+        old_changes = previous['details'].get('changes')
+        new_changes = entry['details'].get('changes')
+        if old_changes and new_changes:
+            changes = dict(old_changes)
+            for field_name, change in new_changes.items():
+                old_value = old_changes[field_name]['old'] if field_name in old_changes else change['old']
+                changes[field_name] = {'old': old_value, 'new': change['new']}
+            details['changes'] = changes
+        merged[key] = {**entry, 'details': details}
+
+    return list(merged.values())
 
-    if not old_instance:
-        logger.debug(f"[AUDIT SIGNALS] No old instance to compare for {instance.__class__.__name__}")
-        return None
 
+@lru_cache(maxsize=None)
+def audit_fields(model):
+    """
+    The (attname, name) pairs of a model's audited columns, worked out once per model.
+    auto_now/auto_now_add columns are left out: they are set after the
+    pre_save snapshot, so they would show up as a change on every save.
+    """
+    return tuple(
+        (field.attname, field.name)
+        for field in model._meta.concrete_fields
+        if not field.auto_created
+        and not getattr(field, 'auto_now', False)
+        and not getattr(field, 'auto_now_add', False)
+    )
+
+
+def saved_fields(model, update_fields=None):
+    """
+    The audit_fields() pairs written by a save: all of them, or only the ones
+    named (by name or attname) in the save's update_fields.
+    """
+    fields = audit_fields(model)
+    if update_fields is None:
+        return fields
+    return tuple(
+        (attname, name) for attname, name in fields
+        if attname in update_fields or name in update_fields
+    )
+
+
+def snapshot_instance(instance, update_fields=None):
+    """
+    Record the instance's current field values as the baseline for the next diff.
+    With update_fields, only those fields move; the rest weren't written.
+    """
+    values = {
+        attname: instance.__dict__[attname]
+        for attname, _ in saved_fields(type(instance), update_fields)
+        if attname in instance.__dict__
+    }
+    if update_fields is None or '_audit_initial' not in instance.__dict__:
+        instance._audit_initial = values
+    else:
+        instance._audit_initial.update(values)
+
+
+def save_old_instance(instance):
+    """
+    Make sure an instance about to be updated has a snapshot of its old state.
+    Instances loaded through AuditedModelMixin already carry one; others
+    (e.g. built by hand with a pk) fall back to reading the row.
+    """
+    if not instance.pk or '_audit_initial' in instance.__dict__:
+        return
+
+    attnames = [attname for attname, _ in audit_fields(type(instance))]
+    row = instance.__class__.objects.filter(pk=instance.pk).values(*attnames).first()
+    if row is None:
+        return
+
+    instance._audit_initial = row
+
+
+def audit_value(value):
+    """Return a value as it should be stored in the JSON details of an AuditLog."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def diff_field_values(instance, old_values, update_fields=None):
+    """
+    Compare an instance against a dict of old values keyed by attname.
+    Foreign keys are compared on their raw ids (e.g. department_id), so no
+    related object is loaded. Returns {field_name: {'old': ..., 'new': ...}}.
+    """
     changes = {}
-    for field in instance._meta.fields:
-        # Skip auto fields and relations that might cause issues
-        if field.auto_created:
+    for attname, name in saved_fields(type(instance), update_fields):
+        # Skip fields that weren't loaded
+        if attname not in old_values:
             continue
 
-        field_name = field.name
-        old_value = getattr(old_instance, field_name, None)
-        new_value = getattr(instance, field_name, None)
-
-        # Convert to string for comparison (handles dates, foreign keys, etc.)
-        old_str = str(old_value) if old_value is not None else None
-        new_str = str(new_value) if new_value is not None else None
+        old_value = old_values[attname]
+        new_value = getattr(instance, attname)
 
-        if old_str != new_str:
-            changes[field_name] = {
-                'old': old_str,
-                'new': new_str
+        if old_value != new_value:
+            changes[name] = {
+                'old': audit_value(old_value),
+                'new': audit_value(new_value)
             }
 
-    # Clean up the stored old instance
-    if key in _thread_locals.__dict__:
-        del _thread_locals.__dict__[key]
+    return changes
 
-    logger.info(f"[AUDIT SIGNALS] Detected {len(changes)} changes for {instance.__class__.__name__}: {list(changes.keys())}")
+
+def get_instance_changes(instance, update_fields=None):
+    """
+    Get the changes between the instance's snapshot and its current values,
+    limited to update_fields when the save named them.
+    Returns a dict of {field_name: {'old': old_value, 'new': new_value}}
+    and moves the snapshot forward, so a later save diffs against this one.
+    """
+    initial = instance.__dict__.get('_audit_initial')
+
+    if initial is None:
+        return None
+
+    changes = diff_field_values(instance, initial, update_fields)
+    snapshot_instance(instance, update_fields)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[AUDIT SIGNALS] Detected %d changes for %s: %s", len(changes), instance.__class__.__name__, list(changes))
     return changes if changes else None
 
 
@@ -122,491 +274,291 @@ def create_audit_log(action, instance, details=None):
         instance: The model instance being modified
         details: Optional dict with additional details
     """
+    if _audit_disabled.get():
+        return
+
     user = get_current_user()
 
     # Get table name for logging
     table_name = f"{instance._meta.app_label}_{instance._meta.model_name}"
 
-    logger.info(f"[AUDIT SIGNALS] create_audit_log called: action={action}, table={table_name}, id={instance.pk}, user={user}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[AUDIT SIGNALS] create_audit_log called: action=%s, table=%s, id=%s, user=%s", action, table_name, instance.pk, user)
 
     # If no user in thread local, skip audit (e.g., system operations, migrations, etc.)
     if not user or not user.is_authenticated:
-        logger.warning(f"[AUDIT SIGNALS] Skipping audit log - no authenticated user (user={user})")
+        logger.warning("[AUDIT SIGNALS] Skipping audit log - no authenticated user (user=%s)", user)
+        return
+
+    entry = {
+        # Stamped now, not when the buffered entry is finally written
+        'timestamp': timezone.now(),
+        'system_user': user,
+        'action': action,
+        'target_table': table_name,
+        'target_id': instance.pk,
+        'details': details or {},
+    }
+
+    buffer = _audit_buffer.get()
+    if buffer is not None:
+        # Queued on commit so entries from a rolled back transaction are
+        # dropped, just as a direct INSERT inside it would be
+        transaction.on_commit(lambda: buffer.append(entry))
         return
 
     try:
         # Create the audit log
-        audit_log = AuditLog.objects.create(
-            system_user=user,
-            action=action,
-            target_table=table_name,
-            target_id=instance.pk,
-            details=details or {}
-        )
-        logger.info(f"[AUDIT SIGNALS] ✓ Audit log created: ID={audit_log.id}, user={user.username}, action={action}, table={table_name}")
+        audit_log = AuditLog.objects.create(**entry)
+        logger.info("[AUDIT SIGNALS] ✓ Audit log created: ID=%s, user=%s, action=%s, table=%s", audit_log.id, user.username, action, table_name)
     except Exception as e:
-        logger.error(f"[AUDIT SIGNALS] ✗ Failed to create audit log: {e}", exc_info=True)
+        logger.error("[AUDIT SIGNALS] ✗ Failed to create audit log: %s", e, exc_info=True)
 
 
-def get_model_diff(instance):
+def register_audit(model, create_details, delete_details, update_details=None,
+                   diff=None, sensitive=(), skip_unchanged=False):
     """
-    Get changed fields from a model instance.
-    Only works on UPDATE operations.
+    Connect the save and delete audit receivers for a model.
+
+    Args:
+        model: The model class to audit
+        create_details: Callable building the details of a CREATE entry
+        delete_details: Callable building the details of a DELETE entry
+        update_details: Callable building the details of an UPDATE entry
+            (defaults to create_details)
+        diff: 'snapshot' to diff updates against the instance's snapshot
+            (the model needs AuditedModelMixin), None to not record changes
+        sensitive: Fields never written to the recorded changes
+        skip_unchanged: Don't audit updates without recorded changes
     """
-    if not instance.pk:
-        return None
+    update_details = update_details or create_details
+    name = model.__name__
+    uid = model._meta.label_lower
+
+    def on_pre_save(sender, instance, **kwargs):
+        if auditing_active():
+            save_old_instance(instance)
+
+    def on_save(sender, instance, created, update_fields=None, **kwargs):
+        # No user (shell, migrations, fixtures): no details, diff or query
+        if not auditing_active():
+            if diff == 'snapshot':
+                # Keep the baseline current so a later audited save doesn't report these changes
+                snapshot_instance(instance, update_fields)
+            return
 
-    try:
-        # Get the old version from database
-        old_instance = instance.__class__.objects.get(pk=instance.pk)
-
-        # Compare fields
-        changes = {}
-        for field in instance._meta.fields:
-            field_name = field.name
-            old_value = getattr(old_instance, field_name, None)
-            new_value = getattr(instance, field_name, None)
-
-            # Convert to string for comparison (handles dates, foreign keys, etc.)
-            old_str = str(old_value) if old_value is not None else None
-            new_str = str(new_value) if new_value is not None else None
-
-            if old_str != new_str:
-                changes[field_name] = {
-                    'old': old_str,
-                    'new': new_str
-                }
-
-        return changes if changes else None
-    except instance.__class__.DoesNotExist:
-        return None
+        action = 'CREATE' if created else 'UPDATE'
+        logger.info("[AUDIT SIGNALS] %s signal fired: action=%s, id=%s", name, action, instance.pk)
 
+        if created:
+            if diff == 'snapshot':
+                # Baseline for later saves of this same instance
+                snapshot_instance(instance)
+            create_audit_log(action=action, instance=instance, details=create_details(instance))
+            return
 
-def get_instance_details(instance):
-    """
-    Get basic details about an instance for CREATE/DELETE operations.
-    """
-    details = {}
+        details = update_details(instance)
+        if diff is not None:
+            # update_fields, when given, is exactly what was written
+            if update_fields is not None and set(update_fields) <= set(sensitive):
+                snapshot_instance(instance, update_fields)
+                changes = None
+            else:
+                changes = get_instance_changes(instance, update_fields)
+            for field_name in sensitive:
+                (changes or {}).pop(field_name, None)
+            if changes:
+                details['changes'] = changes
+            elif skip_unchanged:
+                logger.info("[AUDIT SIGNALS] No changes detected for %s %s, skipping audit", name, instance.pk)
+                return
 
-    # Add string representation
-    details['str_representation'] = str(instance)
+        create_audit_log(action=action, instance=instance, details=details)
 
-    # Add key fields based on model type
-    if hasattr(instance, 'inventory_code'):
-        details['inventory_code'] = instance.inventory_code
-    if hasattr(instance, 'rut'):
-        details['rut'] = instance.rut
-    if hasattr(instance, 'name'):
-        details['name'] = instance.name
-    if hasattr(instance, 'username'):
-        details['username'] = instance.username
-    if hasattr(instance, 'email'):
-        details['email'] = instance.email
+    def on_delete(sender, instance, **kwargs):
+        if not auditing_active():
+            return
+        create_audit_log(action='DELETE', instance=instance, details=delete_details(instance))
 
-    return details
+    if diff == 'snapshot':
+        pre_save.connect(on_pre_save, sender=model, weak=False, dispatch_uid=f'audit_{uid}_pre_save')
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f'audit_{uid}_save')
+    pre_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=f'audit_{uid}_delete')
 
 
 # =============================================================================
 # ASSET MODELS
 # =============================================================================
 
-@receiver(pre_save, sender=Asset)
-def asset_pre_save(sender, instance, **kwargs):
-    """Capture the old state before saving."""
-    save_old_instance(instance)
-
-
-@receiver(post_save, sender=Asset)
-def audit_asset_save(sender, instance, created, **kwargs):
-    """Audit Asset creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    logger.info(f"[AUDIT SIGNALS] Asset signal fired: action={action}, inventory_code={instance.inventory_code}")
-
-    if created:
-        # For CREATE, save basic info
-        details = {
-            'inventory_code': instance.inventory_code,
-            'asset_type': instance.asset_type,
-            'brand': instance.brand,
-            'model': instance.model,
-            'status': instance.status,
-        }
-    else:
-        # For UPDATE, only save what changed
-        changes = get_instance_changes(instance)
-        if not changes:
-            logger.info(f"[AUDIT SIGNALS] No changes detected for Asset {instance.inventory_code}, skipping audit")
-            return
-
-        details = {
-            'inventory_code': instance.inventory_code,
-            'changes': changes
-        }
-
-    create_audit_log(action=action, instance=instance, details=details)
-
-
-@receiver(pre_delete, sender=Asset)
-def audit_asset_delete(sender, instance, **kwargs):
-    """Audit Asset deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'inventory_code': instance.inventory_code,
-            'asset_type': instance.asset_type,
-            'brand': instance.brand,
-            'model': instance.model,
-        }
-    )
-
-
-@receiver(post_save, sender=ComputerDetail)
-def audit_computer_detail_save(sender, instance, created, **kwargs):
-    """Audit ComputerDetail creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    create_audit_log(
-        action=action,
-        instance=instance,
-        details={
-            'asset_inventory_code': instance.asset.inventory_code if instance.asset else None,
-            'cpu_model': instance.cpu_model,
-            'ram_gb': str(instance.ram_gb) if instance.ram_gb else None,
-        }
-    )
-
-
-@receiver(pre_delete, sender=ComputerDetail)
-def audit_computer_detail_delete(sender, instance, **kwargs):
-    """Audit ComputerDetail deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'asset_inventory_code': instance.asset.inventory_code if instance.asset else None,
-        }
-    )
+register_audit(
+    Asset,
+    create_details=lambda i: {
+        'inventory_code': i.inventory_code,
+        'asset_type': i.asset_type,
+        'brand': i.brand,
+        'model': i.model,
+        'status': i.status,
+    },
+    update_details=lambda i: {'inventory_code': i.inventory_code},
+    delete_details=lambda i: {
+        'inventory_code': i.inventory_code,
+        'asset_type': i.asset_type,
+        'brand': i.brand,
+        'model': i.model,
+    },
+    diff='snapshot',
+    skip_unchanged=True,
+)
+
+register_audit(
+    ComputerDetail,
+    create_details=lambda i: {
+        'asset_inventory_code': i.asset.inventory_code if i.asset else None,
+        'cpu_model': i.cpu_model,
+        'ram_gb': str(i.ram_gb) if i.ram_gb else None,
+    },
+    delete_details=lambda i: {
+        'asset_inventory_code': i.asset.inventory_code if i.asset else None,
+    },
+)
 
 
 # =============================================================================
 # USER MODELS
 # =============================================================================
 
-@receiver(pre_save, sender=Employee)
-def employee_pre_save(sender, instance, **kwargs):
-    """Capture the old state before saving."""
-    save_old_instance(instance)
-
-
-@receiver(post_save, sender=Employee)
-def audit_employee_save(sender, instance, created, **kwargs):
-    """Audit Employee creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    logger.info(f"[AUDIT SIGNALS] Employee signal fired: action={action}, id={instance.id}, rut={instance.rut}")
-
-    if created:
-        # For CREATE, save basic info
-        details = {
-            'rut': instance.rut,
-            'first_name': instance.first_name,
-            'last_name': instance.last_name,
-            'email': instance.email,
-            'department': instance.department.name if instance.department else None,
-        }
-    else:
-        # For UPDATE, only save what changed
-        changes = get_instance_changes(instance)
-        if not changes:
-            logger.info(f"[AUDIT SIGNALS] No changes detected for Employee {instance.rut}, skipping audit")
-            return
-
-        details = {
-            'rut': instance.rut,
-            'changes': changes
-        }
-
-    create_audit_log(action=action, instance=instance, details=details)
-
-
-@receiver(pre_delete, sender=Employee)
-def audit_employee_delete(sender, instance, **kwargs):
-    """Audit Employee deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'rut': instance.rut,
-            'first_name': instance.first_name,
-            'last_name': instance.last_name,
-            'email': instance.email,
-        }
-    )
-
-
-@receiver(pre_save, sender=Department)
-def department_pre_save(sender, instance, **kwargs):
-    """Capture the old state before saving."""
-    save_old_instance(instance)
-
-
-@receiver(post_save, sender=Department)
-def audit_department_save(sender, instance, created, **kwargs):
-    """Audit Department creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    logger.info(f"[AUDIT SIGNALS] Department signal fired: action={action}, id={instance.id}, name={instance.name}")
-
-    if created:
-        # For CREATE, save basic info
-        details = {'name': instance.name}
-    else:
-        # For UPDATE, only save what changed
-        changes = get_instance_changes(instance)
-        if not changes:
-            logger.info(f"[AUDIT SIGNALS] No changes detected for Department {instance.name}, skipping audit")
-            return
-
-        details = {
-            'name': instance.name,
-            'changes': changes
-        }
-
-    create_audit_log(action=action, instance=instance, details=details)
-
-
-@receiver(pre_delete, sender=Department)
-def audit_department_delete(sender, instance, **kwargs):
-    """Audit Department deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={'name': instance.name}
-    )
-
-
-@receiver(post_save, sender=User)
-def audit_user_save(sender, instance, created, **kwargs):
-    """Audit CustomUser creation and updates."""
-    # Skip audit for password changes (security)
-    if not created and 'password' in kwargs.get('update_fields', []):
-        return
-
-    if created:
-        create_audit_log(
-            action='CREATE',
-            instance=instance,
-            details={
-                'username': instance.username,
-                'email': instance.email,
-                'role': instance.role,
-                'is_active': instance.is_active,
-            }
-        )
-    else:
-        changes = get_model_diff(instance)
-        if changes:
-            # Remove password from changes
-            changes.pop('password', None)
-            if changes:
-                create_audit_log(
-                    action='UPDATE',
-                    instance=instance,
-                    details={
-                        'username': instance.username,
-                        'changes': changes
-                    }
-                )
-
-
-@receiver(pre_delete, sender=User)
-def audit_user_delete(sender, instance, **kwargs):
-    """Audit CustomUser deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'username': instance.username,
-            'email': instance.email,
-            'role': instance.role,
-        }
-    )
+register_audit(
+    Employee,
+    create_details=lambda i: {
+        'rut': i.rut,
+        'first_name': i.first_name,
+        'last_name': i.last_name,
+        'email': i.email,
+        'department': i.department.name if i.department else None,
+    },
+    update_details=lambda i: {'rut': i.rut},
+    delete_details=lambda i: {
+        'rut': i.rut,
+        'first_name': i.first_name,
+        'last_name': i.last_name,
+        'email': i.email,
+    },
+    diff='snapshot',
+    skip_unchanged=True,
+)
+
+register_audit(
+    Department,
+    create_details=lambda i: {'name': i.name},
+    delete_details=lambda i: {'name': i.name},
+    diff='snapshot',
+    skip_unchanged=True,
+)
+
+register_audit(
+    User,
+    create_details=lambda i: {
+        'username': i.username,
+        'email': i.email,
+        'role': i.role,
+        'is_active': i.is_active,
+    },
+    update_details=lambda i: {'username': i.username},
+    delete_details=lambda i: {
+        'username': i.username,
+        'email': i.email,
+        'role': i.role,
+    },
+    diff='snapshot',
+    # Never log password changes (security)
+    sensitive=('password',),
+    skip_unchanged=True,
+)
 
 
 # =============================================================================
 # SOFTWARE MODELS
 # =============================================================================
 
-@receiver(post_save, sender=SoftwareCatalog)
-def audit_software_save(sender, instance, created, **kwargs):
-    """Audit SoftwareCatalog creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    details = {
-        'name': instance.name,
-        'developer': instance.developer,
-    }
-
-    if not created:
-        changes = get_model_diff(instance)
-        if changes:
-            details['changes'] = changes
-
-    create_audit_log(action=action, instance=instance, details=details)
-
-
-@receiver(pre_delete, sender=SoftwareCatalog)
-def audit_software_delete(sender, instance, **kwargs):
-    """Audit SoftwareCatalog deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'name': instance.name,
-            'developer': instance.developer,
-        }
-    )
-
-
-@receiver(post_save, sender=License)
-def audit_license_save(sender, instance, created, **kwargs):
-    """Audit License creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    details = {
-        'software': instance.software.name if instance.software else None,
-        'quantity': instance.quantity,
-        'purchase_date': instance.purchase_date.isoformat() if instance.purchase_date else None,
-        'expiration_date': instance.expiration_date.isoformat() if instance.expiration_date else None,
+register_audit(
+    SoftwareCatalog,
+    create_details=lambda i: {
+        'name': i.name,
+        'developer': i.developer,
+    },
+    delete_details=lambda i: {
+        'name': i.name,
+        'developer': i.developer,
+    },
+    diff='snapshot',
+)
+
+register_audit(
+    License,
+    create_details=lambda i: {
+        'software': i.software.name if i.software else None,
+        'quantity': i.quantity,
+        'purchase_date': i.purchase_date.isoformat() if i.purchase_date else None,
+        'expiration_date': i.expiration_date.isoformat() if i.expiration_date else None,
         # Don't log the actual license key for security
-        'has_license_key': bool(instance.license_key),
-    }
-
-    if not created:
-        changes = get_model_diff(instance)
-        if changes:
-            # Remove license_key from changes for security
-            changes.pop('license_key', None)
-            if changes:
-                details['changes'] = changes
-
-    create_audit_log(action=action, instance=instance, details=details)
-
-
-@receiver(pre_delete, sender=License)
-def audit_license_delete(sender, instance, **kwargs):
-    """Audit License deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'software': instance.software.name if instance.software else None,
-            'quantity': instance.quantity,
-        }
-    )
-
-
-@receiver(post_save, sender=InstalledSoftware)
-def audit_installed_software_save(sender, instance, created, **kwargs):
-    """Audit InstalledSoftware creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    create_audit_log(
-        action=action,
-        instance=instance,
-        details={
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'software': instance.software.name if instance.software else None,
-            'license': instance.license.id if instance.license else None,
-        }
-    )
-
-
-@receiver(pre_delete, sender=InstalledSoftware)
-def audit_installed_software_delete(sender, instance, **kwargs):
-    """Audit InstalledSoftware deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'software': instance.software.name if instance.software else None,
-        }
-    )
+        'has_license_key': bool(i.license_key),
+    },
+    delete_details=lambda i: {
+        'software': i.software.name if i.software else None,
+        'quantity': i.quantity,
+    },
+    diff='snapshot',
+    sensitive=('license_key',),
+)
+
+register_audit(
+    InstalledSoftware,
+    create_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'software': i.software.name if i.software else None,
+        'license': i.license.id if i.license else None,
+    },
+    delete_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'software': i.software.name if i.software else None,
+    },
+)
 
 
 # =============================================================================
 # AUDITING MODELS
 # =============================================================================
 
-@receiver(pre_save, sender=ComplianceWarning)
-def compliance_warning_pre_save(sender, instance, **kwargs):
-    """Capture the old state before saving."""
-    save_old_instance(instance)
-
-
-@receiver(post_save, sender=ComplianceWarning)
-def audit_compliance_warning_save(sender, instance, created, **kwargs):
-    """Audit ComplianceWarning creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    logger.info(f"[AUDIT SIGNALS] ComplianceWarning signal fired: action={action}, id={instance.id}")
-
-    if created:
-        # For CREATE, save basic info
-        details = {
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'category': instance.category,
-            'status': instance.status,
-            'description': instance.description,
-        }
-    else:
-        # For UPDATE, only save what changed
-        changes = get_instance_changes(instance)
-        if not changes:
-            logger.info(f"[AUDIT SIGNALS] No changes detected for ComplianceWarning {instance.id}, skipping audit")
-            return
-
-        details = {
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'category': instance.category,
-            'changes': changes
-        }
-
-    create_audit_log(action=action, instance=instance, details=details)
-
-
-@receiver(pre_delete, sender=ComplianceWarning)
-def audit_compliance_warning_delete(sender, instance, **kwargs):
-    """Audit ComplianceWarning deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'category': instance.category,
-            'status': instance.status,
-        }
-    )
-
-
-@receiver(post_save, sender=AssetCheckin)
-def audit_asset_checkin_save(sender, instance, created, **kwargs):
-    """Audit AssetCheckin creation and updates."""
-    action = 'CREATE' if created else 'UPDATE'
-    create_audit_log(
-        action=action,
-        instance=instance,
-        details={
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'employee': instance.employee.rut if instance.employee else None,
-            'physical_state': instance.physical_state,
-        }
-    )
-
-
-@receiver(pre_delete, sender=AssetCheckin)
-def audit_asset_checkin_delete(sender, instance, **kwargs):
-    """Audit AssetCheckin deletion."""
-    create_audit_log(
-        action='DELETE',
-        instance=instance,
-        details={
-            'asset': instance.asset.inventory_code if instance.asset else None,
-            'employee': instance.employee.rut if instance.employee else None,
-        }
-    )
+register_audit(
+    ComplianceWarning,
+    create_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'category': i.category,
+        'status': i.status,
+        'description': i.description,
+    },
+    update_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'category': i.category,
+    },
+    delete_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'category': i.category,
+        'status': i.status,
+    },
+    diff='snapshot',
+    skip_unchanged=True,
+)
+
+register_audit(
+    AssetCheckin,
+    create_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'employee': i.employee.rut if i.employee else None,
+        'physical_state': i.physical_state,
+    },
+    delete_details=lambda i: {
+        'asset': i.asset.inventory_code if i.asset else None,
+        'employee': i.employee.rut if i.employee else None,
+    },
+)
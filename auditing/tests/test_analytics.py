@@ -0,0 +1,387 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.utils import timezone
+from rest_framework.test import APIClient
+from assets.models import Asset, ComputerDetail
+from software.models import SoftwareCatalog, License, InstalledSoftware
+from users.models import CustomUser, Employee
+from ..models import ComplianceWarning
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+def report_data(response):
+    """decode a streamed report response"""
+    return json.loads(b"".join(response.streaming_content))
+
+
+@pytest.fixture
+def technician_user():
+    """fixture that creates a technician user"""
+    return CustomUser.objects.create_user(
+        username="tech_analytics", password="pw", role=CustomUser.RoleChoices.TECHNICIAN
+    )
+
+
+@pytest.fixture
+def computers():
+    """notebooks with 2, 8, 8 and 64 GB of RAM plus a monitor without details"""
+    for i, ram_gb in enumerate([2, 8, 8, 64]):
+        asset = Asset.objects.create(
+            inventory_code=f"AN-NOTE-{i}",
+            serial_number=f"AN-SN-{i}",
+            asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+        )
+        ComputerDetail.objects.create(asset=asset, ram_gb=ram_gb)
+    Asset.objects.create(
+        inventory_code="AN-MON-0",
+        serial_number="AN-SN-MON",
+        asset_type=Asset.AssetTypeChoices.MONITOR,
+    )
+
+
+@pytest.mark.django_db
+def test_assets_distribution_ram_buckets(api_client, technician_user, computers):
+    """test ram buckets count computers by range and ignore assets without details"""
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/analytics/assets-distribution/")
+
+    assert response.status_code == 200
+    assert response.data["ram_distribution"] == [
+        {"label": "< 4GB", "count": 1},
+        {"label": "4-8GB", "count": 0},
+        {"label": "8-16GB", "count": 2},
+        {"label": "16-32GB", "count": 0},
+        {"label": "> 32GB", "count": 1},
+    ]
+
+
+@pytest.fixture
+def licensed_software():
+    """office has 10 + 5 seats with 4 installs, zip has 2 seats with 3 installs"""
+    office = SoftwareCatalog.objects.create(name="Office", developer="Microsoft")
+    zip_tool = SoftwareCatalog.objects.create(name="WinZip", developer="Corel")
+    SoftwareCatalog.objects.create(name="Notepad++", developer="Don Ho")
+
+    office_big = License.objects.create(software=office, quantity=10)
+    office_small = License.objects.create(software=office, quantity=5)
+    zip_license = License.objects.create(software=zip_tool, quantity=2)
+
+    for i, (software, license) in enumerate([
+        (office, office_big), (office, office_big), (office, office_big),
+        (office, office_small),
+    ]):
+        asset = Asset.objects.create(inventory_code=f"LIC-O-{i}", serial_number=f"LIC-O-SN-{i}")
+        InstalledSoftware.objects.create(asset=asset, software=software, license=license)
+    for i in range(3):
+        asset = Asset.objects.create(inventory_code=f"LIC-Z-{i}", serial_number=f"LIC-Z-SN-{i}")
+        InstalledSoftware.objects.create(asset=asset, software=zip_tool, license=zip_license)
+
+
+@pytest.mark.django_db
+def test_software_analytics_license_usage(api_client, technician_user, licensed_software):
+    """test license usage sums seats and installs per software without double counting"""
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/analytics/software/")
+
+    assert response.status_code == 200
+    assert response.data["license_usage"] == [
+        {"name": "Office (Microsoft)", "total": 15, "in_use": 4, "available": 11},
+        {"name": "WinZip (Corel)", "total": 2, "in_use": 3, "available": 0},
+    ]
+
+
+@pytest.mark.django_db
+def test_software_analytics_installations(api_client, technician_user, licensed_software):
+    """test top installed counts every install and without license only unlicensed ones"""
+    zip_tool = SoftwareCatalog.objects.get(name="WinZip")
+    for i in range(2):
+        asset = Asset.objects.create(inventory_code=f"LIC-ZF-{i}", serial_number=f"LIC-ZF-SN-{i}")
+        InstalledSoftware.objects.create(asset=asset, software=zip_tool)
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/analytics/software/")
+
+    assert response.status_code == 200
+    assert [(item["label"], item["count"]) for item in response.data["top_installed"]] == [
+        ("WinZip (Corel)", 5),
+        ("Office (Microsoft)", 4),
+    ]
+    assert [(item["label"], item["count"]) for item in response.data["without_license"]] == [
+        ("WinZip (Corel)", 2),
+    ]
+
+
+@pytest.mark.django_db
+def test_licenses_usage_report_status_filter(api_client, technician_user, licensed_software):
+    """test the usage report labels each license and filters by that label"""
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/licenses-usage/", {"status": "exceeded"})
+
+    assert response.status_code == 200
+    data = report_data(response)
+    assert data["count"] == 1
+    exceeded = data["results"][0]
+    assert exceeded["software_name"] == "WinZip"
+    assert exceeded["in_use"] == 3
+    assert exceeded["available"] == -1
+    assert exceeded["status"] == "exceeded"
+
+    response = api_client.get("/api/reports/licenses-usage/")
+    assert sorted(item["status"] for item in report_data(response)["results"]) == [
+        "available", "available", "exceeded",
+    ]
+
+
+@pytest.mark.django_db
+def test_licenses_usage_report_browsable_api(api_client, technician_user, licensed_software):
+    """test reports still render through drf for non json formats"""
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/licenses-usage/", {"format": "api"})
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/html")
+    assert response.data["count"] == 3
+
+
+@pytest.mark.django_db
+def test_summary_metrics_assets(api_client, technician_user, computers):
+    """test summary asset counts by status and average ram of computers"""
+    Asset.objects.filter(inventory_code="AN-NOTE-0").update(status=Asset.StatusChoices.ASSIGNED)
+    Asset.objects.filter(inventory_code="AN-NOTE-1").update(status=Asset.StatusChoices.IN_REPAIR)
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/analytics/summary/")
+
+    assert response.status_code == 200
+    assert response.data["assets"] == {
+        "total": 5,
+        "assigned": 1,
+        "in_storage": 3,
+        "in_repair": 1,
+    }
+    assert response.data["hardware"]["avg_ram_gb"] == 20.5
+
+
+@pytest.mark.django_db
+def test_warnings_analytics_trend_fills_missing_days(api_client, technician_user, computers):
+    """test warning trend has one entry per day with zero for days without warnings"""
+    asset = Asset.objects.get(inventory_code="AN-NOTE-0")
+    for days_ago in [0, 0, 3]:
+        warning = ComplianceWarning.objects.create(asset=asset, category="RAM", description="Poca RAM")
+        ComplianceWarning.objects.filter(pk=warning.pk).update(
+            detection_date=timezone.now() - timedelta(days=days_ago)
+        )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/analytics/warnings/")
+
+    assert response.status_code == 200
+    trend = response.data["trend"]
+    assert len(trend) == 31
+    assert [day["count"] for day in trend[-4:]] == [1, 0, 0, 2]
+
+
+@pytest.mark.django_db
+def test_dashboard_bundle_matches_individual_endpoints(api_client, technician_user, computers):
+    """test the bundle returns the same payloads as the separate analytics endpoints"""
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/analytics/all/")
+
+    assert response.status_code == 200
+    assert response.data["summary"] == api_client.get("/api/reports/analytics/summary/").data
+    assert (
+        response.data["assets_distribution"]
+        == api_client.get("/api/reports/analytics/assets-distribution/").data
+    )
+    assert set(response.data) == {
+        "assets_distribution", "employees_distribution", "warnings", "software", "summary",
+    }
+
+
+@pytest.mark.django_db
+def test_dashboard_bundle_requires_authentication(api_client):
+    """test the bundle rejects anonymous requests"""
+    response = api_client.get("/api/reports/analytics/all/")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_warnings_report_rows(api_client, technician_user, computers):
+    """test warnings report rows carry display labels and placeholders for missing relations"""
+    asset = Asset.objects.get(inventory_code="AN-NOTE-0")
+    ComplianceWarning.objects.create(asset=asset, category="RAM", description="Poca RAM")
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/warnings/", {"category": "RAM"})
+
+    assert response.status_code == 200
+    data = report_data(response)
+    assert data["count"] == 1
+    row = data["results"][0]
+    assert row["asset_code"] == "AN-NOTE-0"
+    assert row["asset_type"] == asset.get_asset_type_display()
+    assert row["status"] == ComplianceWarning.StatusChoices.NEW.label
+    assert row["employee"] == "Sin asignar"
+    assert row["department"] == "Sin departamento"
+    assert row["resolved_by"] == ""
+
+
+@pytest.mark.django_db
+def test_warnings_report_dates_match_drf_format(api_client, technician_user, computers):
+    """test streamed and browsable warnings reports format detection_date like drf"""
+    asset = Asset.objects.get(inventory_code="AN-NOTE-0")
+    detected = datetime(2026, 3, 4, 5, 6, 7, 891234, tzinfo=dt_timezone.utc)
+    ComplianceWarning.objects.create(
+        asset=asset, category="RAM", description="Poca RAM", detection_date=detected
+    )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/warnings/")
+    assert report_data(response)["results"][0]["detection_date"] == "2026-03-04T05:06:07.891Z"
+
+    response = api_client.get("/api/reports/warnings/", {"format": "api"})
+    assert response.data["results"][0]["detection_date"] == detected
+
+
+@pytest.mark.django_db
+def test_employees_assets_report_has_assets_filter(api_client, technician_user):
+    """test has_assets lists each employee once and splits employees with and without assets"""
+    owner = Employee.objects.create(rut="55.555.555-5", first_name="Con", last_name="Equipos")
+    Employee.objects.create(rut="66.666.666-6", first_name="Sin", last_name="Equipos")
+    for i in range(2):
+        Asset.objects.create(inventory_code=f"EMP-A-{i}", serial_number=f"EMP-A-SN-{i}", employee=owner)
+
+    api_client.force_authenticate(user=technician_user)
+    with_assets = report_data(
+        api_client.get("/api/reports/employees-assets/", {"has_assets": "true"})
+    )
+    without_assets = report_data(
+        api_client.get("/api/reports/employees-assets/", {"has_assets": "false"})
+    )
+
+    assert [row["rut"] for row in with_assets["results"]] == ["55.555.555-5"]
+    assert with_assets["results"][0]["assets_count"] == 2
+    assert [row["rut"] for row in without_assets["results"]] == ["66.666.666-6"]
+
+
+@pytest.mark.django_db
+def test_licenses_usage_report_cursor_pages(api_client, technician_user, licensed_software):
+    """test page_size switches the report to cursor pages that cover every license once"""
+    api_client.force_authenticate(user=technician_user)
+    first = api_client.get("/api/reports/licenses-usage/", {"page_size": 2})
+
+    assert first.status_code == 200
+    assert len(first.data["results"]) == 2
+    assert first.data["next"]
+
+    second = api_client.get(first.data["next"])
+    assert len(second.data["results"]) == 1
+    assert second.data["next"] is None
+    assert sorted(
+        item["quantity"] for item in first.data["results"] + second.data["results"]
+    ) == [2, 5, 10]
+
+
+@pytest.mark.django_db
+def test_software_installations_report_grouped_by_software(api_client, technician_user, licensed_software):
+    """test group_by=software returns one counted row per software"""
+    zip_tool = SoftwareCatalog.objects.get(name="WinZip")
+    asset = Asset.objects.create(inventory_code="LIC-Z-FREE", serial_number="LIC-Z-SN-FREE")
+    InstalledSoftware.objects.create(asset=asset, software=zip_tool)
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/software-installations/", {"group_by": "software"})
+
+    assert response.status_code == 200
+    assert report_data(response)["results"] == [
+        {
+            "software_name": "Office",
+            "software_developer": "Microsoft",
+            "installations": 4,
+            "with_license": 4,
+            "without_license": 0,
+        },
+        {
+            "software_name": "WinZip",
+            "software_developer": "Corel",
+            "installations": 4,
+            "with_license": 3,
+            "without_license": 1,
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_assets_specs_report_ram_range(api_client, technician_user, computers):
+    """test the ram range keeps computers inside it and skips assets without details"""
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/assets-specs/", {"ram_min": 4, "ram_max": 8})
+
+    assert response.status_code == 200
+    data = report_data(response)
+    assert sorted(row["inventory_code"] for row in data["results"]) == ["AN-NOTE-1", "AN-NOTE-2"]
+
+
+@pytest.mark.django_db
+def test_licenses_usage_report_masks_keys(api_client, technician_user):
+    """test only the last four key characters are shown and short keys count as missing"""
+    office = SoftwareCatalog.objects.create(name="Office", developer="Microsoft")
+    License.objects.create(software=office, quantity=1, license_key="ABCD-1234-WXYZ")
+    License.objects.create(software=office, quantity=1, license_key="ABC")
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/licenses-usage/")
+
+    assert sorted(row["license_key_display"] for row in report_data(response)["results"]) == [
+        "****-****-****-WXYZ", "Sin clave",
+    ]
+
+
+@pytest.mark.django_db
+def test_software_installations_report_rows(api_client, technician_user):
+    """test installation rows show the key tail and placeholders for missing relations"""
+    office = SoftwareCatalog.objects.create(name="Office", developer="Microsoft")
+    license = License.objects.create(software=office, quantity=1, license_key="ABCD-1234-WXYZ")
+    employee = Employee.objects.create(rut="77.777.777-7", first_name="Ana", last_name="Rojas")
+    licensed = Asset.objects.create(inventory_code="INS-1", serial_number="INS-SN-1", employee=employee)
+    unlicensed = Asset.objects.create(inventory_code="INS-2", serial_number="INS-SN-2")
+    InstalledSoftware.objects.create(asset=licensed, software=office, license=license)
+    InstalledSoftware.objects.create(asset=unlicensed, software=office)
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get("/api/reports/software-installations/")
+
+    rows = {row["asset_code"]: row for row in report_data(response)["results"]}
+    assert rows["INS-1"]["has_license"] is True
+    assert rows["INS-1"]["license_key"] == "WXYZ"
+    assert rows["INS-1"]["employee"] == "Ana Rojas"
+    assert rows["INS-2"]["has_license"] is False
+    assert rows["INS-2"]["license_key"] == ""
+    assert rows["INS-2"]["employee"] == "Sin asignar"
+    assert rows["INS-2"]["version"] == "N/A"
+
+
+@pytest.mark.django_db
+def test_warnings_report_date_filters(api_client, technician_user, computers):
+    """test date bounds filter warnings and malformed dates are rejected"""
+    asset = Asset.objects.get(inventory_code="AN-NOTE-0")
+    for day in [1, 10, 20]:
+        warning = ComplianceWarning.objects.create(asset=asset, category="RAM", description="Poca RAM")
+        ComplianceWarning.objects.filter(pk=warning.pk).update(
+            detection_date=timezone.make_aware(datetime(2025, 1, day, 12))
+        )
+
+    api_client.force_authenticate(user=technician_user)
+    response = api_client.get(
+        "/api/reports/warnings/", {"date_from": "2025-01-05", "date_to": "2025-01-15"}
+    )
+    assert report_data(response)["count"] == 1
+
+    response = api_client.get("/api/reports/warnings/", {"date_from": "05/01/2025"})
+    assert response.status_code == 400
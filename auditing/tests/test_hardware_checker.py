@@ -0,0 +1,72 @@
+import pytest
+from assets.models import Asset, ComputerDetail, StorageDevice
+from ..hardware_checker import get_obsolete_assets
+
+
+def create_computer(code, os_name="Windows 10 Pro", os_version="10.0.19045", ram_gb=16, disks=()):
+    """helper that creates a notebook with hardware details and (capacity, free) disks"""
+    asset = Asset.objects.create(
+        inventory_code=code,
+        serial_number=f"SN-{code}",
+        asset_type=Asset.AssetTypeChoices.NOTEBOOK,
+    )
+    ComputerDetail.objects.create(
+        asset=asset, os_name=os_name, os_version=os_version, ram_gb=ram_gb
+    )
+    for i, (capacity_gb, free_space_gb) in enumerate(disks):
+        StorageDevice.objects.create(
+            asset=asset, model=f"Disk {i}", capacity_gb=capacity_gb, free_space_gb=free_space_gb
+        )
+    return asset
+
+
+@pytest.fixture
+def computers():
+    """one computer per obsolescence rule plus computers that pass every rule"""
+    create_computer("OK-1", disks=[(500, 200)])
+    create_computer("OK-LINUX", os_name="Ubuntu", os_version="1.0", disks=[(500, 200)])
+    create_computer("OK-ZERO-DISK", disks=[(0, 0), (500, None)])
+    create_computer("OLD-OS", os_version="10.0.9200")
+    create_computer("OLD-OS-EMPTY", os_version="")
+    create_computer("OK-OS-REVISION", os_version="10.0.19041.1")
+    create_computer("LOW-RAM", ram_gb=2)
+    create_computer("LOW-DISK", disks=[(500, 200), (1000, 50)])
+    Asset.objects.create(
+        inventory_code="NO-DETAIL",
+        serial_number="SN-NO-DETAIL",
+        asset_type=Asset.AssetTypeChoices.DESKTOP,
+    )
+    Asset.objects.create(
+        inventory_code="MONITOR",
+        serial_number="SN-MONITOR",
+        asset_type=Asset.AssetTypeChoices.MONITOR,
+    )
+
+
+@pytest.mark.django_db
+def test_get_obsolete_assets_applies_every_rule(computers):
+    """test only computers failing a rule are returned, each with its reasons"""
+    obsolete = {item["inventory_code"]: item for item in get_obsolete_assets()}
+
+    assert set(obsolete) == {"OLD-OS", "OLD-OS-EMPTY", "LOW-RAM", "LOW-DISK"}
+    assert obsolete["OLD-OS"]["details"] == {
+        "os_version": "10.0.9200",
+        "os_min_required": "10.0.19041",
+    }
+    assert obsolete["LOW-RAM"]["details"] == {"ram_gb": 2, "ram_min_required": 4.0}
+    assert obsolete["LOW-DISK"]["details"] == {
+        "low_disk_drives": [{"model": "Disk 1", "free_percent": 5.0, "min_required": 10.0}]
+    }
+
+
+@pytest.mark.django_db
+def test_computer_detail_keeps_os_version_parts_in_sync():
+    """test parsed os version columns follow os_version on create and update_fields saves"""
+    asset = create_computer("PARTS", os_version="10.0.22621")
+    detail = asset.computerdetail
+    assert (detail.os_major, detail.os_minor, detail.os_build) == (10, 0, 22621)
+
+    detail.os_version = "6.1"
+    detail.save(update_fields=["os_version"])
+    detail.refresh_from_db()
+    assert (detail.os_major, detail.os_minor, detail.os_build) == (6, 1, 0)
@@ -28,6 +28,23 @@ def test_asset_checkin_creation():
     assert "Auditor Test" in str(checkin)
 
 
+@pytest.mark.django_db
+def test_asset_checkin_bulk_create_gets_tokens():
+    """test checkins created in bulk each get their own token"""
+    employee = Employee.objects.create(
+        rut="44.444.444-4", first_name="Bulk", last_name="Test"
+    )
+    asset = Asset.objects.create(inventory_code="AUDIT-BULK")
+
+    AssetCheckin.objects.bulk_create(
+        [AssetCheckin(asset=asset, employee=employee) for _ in range(3)]
+    )
+
+    tokens = set(AssetCheckin.objects.values_list("unique_token", flat=True))
+    assert len(tokens) == 3
+    assert "" not in tokens
+
+
 @pytest.mark.django_db
 def test_compliance_warning_creation_and_resolution():
     """test the creation of a warning and his resolution"""
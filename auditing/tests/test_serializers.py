@@ -0,0 +1,37 @@
+import pytest
+from rest_framework.exceptions import ValidationError
+from ..serializers import AgentSoftwareListField, AgentSoftwareSerializer
+
+
+def software_field():
+    return AgentSoftwareListField(child=AgentSoftwareSerializer(), required=False, allow_empty=True)
+
+
+def test_agent_software_list_validates_entries():
+    """test software entries are trimmed and optional fields may be omitted or blank"""
+    value = software_field().run_validation([
+        {"nombre": " Office ", "desarrollador": "Microsoft", "version": "16.0"},
+        {"nombre": "7-Zip", "version": ""},
+    ])
+
+    assert value == [
+        {"nombre": "Office", "desarrollador": "Microsoft", "version": "16.0"},
+        {"nombre": "7-Zip", "version": ""},
+    ]
+
+
+def test_agent_software_list_reports_errors_by_index():
+    """test invalid entries are reported per index and field like the child serializer"""
+    with pytest.raises(ValidationError) as exc_info:
+        software_field().run_validation([
+            {"nombre": "Office"},
+            {"desarrollador": "Nadie"},
+            {"nombre": "x" * 256},
+            "Office",
+        ])
+
+    errors = exc_info.value.detail
+    assert set(errors) == {1, 2, 3}
+    assert errors[1]["nombre"] == ["This field is required."]
+    assert errors[2]["nombre"] == ["Ensure this field has no more than 255 characters."]
+    assert "non_field_errors" in errors[3]
@@ -3,9 +3,12 @@ Tests for automatic audit logging via signals.
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.http import HttpResponse
 from django.test import RequestFactory
+from django.utils import timezone
+from auditing.middleware import AuditLogMiddleware
 from auditing.models import AuditLog
-from auditing.signals import set_current_request, clear_current_request
+from auditing.signals import set_current_request, clear_current_request, get_current_user, audit_disabled
 from users.models import Department, Employee
 from assets.models import Asset
 
@@ -210,3 +213,148 @@ class TestAuditSignals:
         assert AuditLog.objects.count() == initial_count + 3
 
         clear_current_request()
+
+    def test_clear_with_token_restores_previous_request(self, admin_user):
+        """Test that clearing with a token restores the outer request."""
+        outer = create_mock_request(admin_user)
+        outer_token = set_current_request(outer)
+        inner_token = set_current_request(create_mock_request(admin_user))
+
+        clear_current_request(inner_token)
+        assert get_current_user() == admin_user
+
+        clear_current_request(outer_token)
+        assert get_current_user() is None
+
+    def test_middleware_buffers_and_squashes_audit_logs(
+        self, admin_user, django_capture_on_commit_callbacks
+    ):
+        """Test that a request's audit entries are written together, one per updated row."""
+        def view(request):
+            with django_capture_on_commit_callbacks(execute=True):
+                dept = Department.objects.create(name="Compras")
+                dept.name = "Compras y Ventas"
+                dept.save()
+                dept.name = "Adquisiciones"
+                dept.save()
+                # Not written yet: the middleware writes them after the view
+                assert not AuditLog.objects.filter(target_table="users_department").exists()
+            view.finished_at = timezone.now()
+            return HttpResponse()
+
+        AuditLogMiddleware(view)(create_mock_request(admin_user))
+
+        logs = AuditLog.objects.filter(target_table="users_department").order_by("id")
+        assert [log.action for log in logs] == ["CREATE", "UPDATE"]
+        assert logs[1].details["changes"]["name"] == {"old": "Compras", "new": "Adquisiciones"}
+        # Stamped when each change happened, not when they were written
+        assert all(log.timestamp < view.finished_at for log in logs)
+
+    def test_loaded_instance_update_skips_old_state_query(
+        self, admin_user, department, django_assert_num_queries
+    ):
+        """Test that updating a loaded instance diffs against its load-time values."""
+        set_current_request(create_mock_request(admin_user))
+        dept = Department.objects.get(pk=department.pk)
+        dept.name = "IT & Soporte"
+
+        # The UPDATE and the audit insert, no SELECT of the old row
+        with django_assert_num_queries(2):
+            dept.save()
+
+        log = AuditLog.objects.get(action='UPDATE', target_table='users_department', target_id=dept.id)
+        assert log.details["changes"]["name"] == {"old": "IT Department", "new": "IT & Soporte"}
+
+        clear_current_request()
+
+    def test_foreign_key_change_is_recorded_by_id(self, admin_user, department):
+        """Test that a foreign key change is diffed on ids without loading the related rows."""
+        set_current_request(create_mock_request(admin_user))
+        other = Department.objects.create(name="Finanzas")
+        Employee.objects.create(
+            rut="11111111-1", first_name="Ana", last_name="Rojas",
+            email="ana.rojas@test.com", department=department
+        )
+
+        employee = Employee.objects.get(rut="11111111-1")
+        employee.department_id = other.id
+        employee.save()
+
+        log = AuditLog.objects.get(action='UPDATE', target_table='users_employee', target_id=employee.id)
+        assert log.details["changes"]["department"] == {"old": department.id, "new": other.id}
+
+        clear_current_request()
+
+    def test_audit_disabled_skips_audit_logs(self, admin_user):
+        """Test that nothing is audited inside audit_disabled()."""
+        set_current_request(create_mock_request(admin_user))
+
+        with audit_disabled():
+            Department.objects.create(name="Sin Auditoría")
+        assert not AuditLog.objects.filter(target_table='users_department').exists()
+
+        Department.objects.create(name="Con Auditoría")
+        assert AuditLog.objects.filter(target_table='users_department').count() == 1
+
+        clear_current_request()
+
+    def test_update_fields_limits_recorded_changes(self, admin_user, department):
+        """Test that a save with update_fields records only those fields and keeps the rest pending."""
+        set_current_request(create_mock_request(admin_user))
+        Employee.objects.create(
+            rut="22222222-2", first_name="Luis", last_name="Soto",
+            email="luis.soto@test.com", department=department
+        )
+
+        employee = Employee.objects.get(rut="22222222-2")
+        employee.first_name = "Luis Alberto"
+        employee.last_name = "Soto Díaz"
+        employee.save(update_fields=["first_name"])
+        employee.save()
+
+        logs = AuditLog.objects.filter(
+            action='UPDATE', target_table='users_employee', target_id=employee.id
+        ).order_by("id")
+        assert [list(log.details["changes"]) for log in logs] == [["first_name"], ["last_name"]]
+
+        clear_current_request()
+
+    def test_save_without_user_skips_audit_queries(self, department, django_assert_num_queries):
+        """Test that saves outside an authenticated request don't read the old row."""
+        clear_current_request()
+        dept = Department(pk=department.pk, name="Renombrado")
+
+        # Only the UPDATE itself
+        with django_assert_num_queries(1):
+            dept.save()
+
+        assert not AuditLog.objects.filter(target_table='users_department').exists()
+
+    def test_unchanged_asset_save_writes_no_update(self, admin_user):
+        """Test that saving an asset without changes isn't audited (updated_at alone is no change)."""
+        set_current_request(create_mock_request(admin_user))
+        Asset.objects.create(inventory_code="NOOP001", asset_type="NOTEBOOK", status="BODEGA")
+
+        asset = Asset.objects.get(inventory_code="NOOP001")
+        asset.save()
+
+        assert not AuditLog.objects.filter(
+            action='UPDATE', target_table='assets_asset', target_id=asset.id
+        ).exists()
+
+        clear_current_request()
+
+    def test_user_update_records_changes_without_password(self, admin_user):
+        """Test that user updates record their changes and never the password."""
+        set_current_request(create_mock_request(admin_user))
+        User.objects.create_user(username="tecnico", password="pw12345678", email="old@test.com")
+
+        user = User.objects.get(username="tecnico")
+        user.email = "new@test.com"
+        user.set_password("otra-clave-123")
+        user.save()
+
+        log = AuditLog.objects.get(action='UPDATE', target_table='users_customuser', target_id=user.id)
+        assert log.details["changes"] == {"email": {"old": "old@test.com", "new": "new@test.com"}}
+
+        clear_current_request()
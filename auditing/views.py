@@ -403,6 +403,7 @@ def agent_hardware_report(request):
     """
     from assets.models import ComputerDetail, StorageDevice, GraphicsCard
     from software.models import SoftwareCatalog, InstalledSoftware
+    from assets.signals import asset_touch_disabled
     from django.db import transaction
 
     # Validate payload
@@ -429,7 +430,9 @@ def agent_hardware_report(request):
     changes_detected = []
 
     try:
-        with transaction.atomic():
+        # The report sets last_updated_by_agent, which the asset ETag covers,
+        # so the child rows it rewrites don't each touch the asset
+        with transaction.atomic(), asset_touch_disabled():
             # Check if asset with this BIOS UUID exists
             try:
                 computer_detail = ComputerDetail.objects.select_related('asset').get(
@@ -505,7 +508,9 @@ def agent_hardware_report(request):
                     # employee=None, department=None by default
                 )
 
-                computer_detail = ComputerDetail.objects.create(asset=asset)
+                # Saved once below with the reported data instead of an
+                # empty INSERT followed by a full UPDATE
+                computer_detail = ComputerDetail(asset=asset)
 
             # Update ComputerDetail with latest data
             computer_detail.cpu_model = hardware_data['cpu']
@@ -517,7 +522,22 @@ def agent_hardware_report(request):
             computer_detail.motherboard_manufacturer = hardware_data['placa_base']['fabricante']
             computer_detail.motherboard_model = hardware_data['placa_base']['modelo']
             computer_detail.last_updated_by_agent = timezone.now()
-            computer_detail.save()
+
+            if asset_created:
+                computer_detail.save(force_insert=True)
+            else:
+                # Only write the columns the agent reports
+                computer_detail.save(update_fields=[
+                    'cpu_model',
+                    'ram_gb',
+                    'os_name',
+                    'os_version',
+                    'os_arch',
+                    'unique_identifier',
+                    'motherboard_manufacturer',
+                    'motherboard_model',
+                    'last_updated_by_agent',
+                ])
 
             # Update storage devices (delete old, create new)
             asset.storage_devices.all().delete()
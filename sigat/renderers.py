@@ -0,0 +1,23 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+    Types orjson doesn't know (Decimal, lazy strings, querysets...) fall back
+    to DRF's JSONEncoder so output matches the default JSONRenderer.
+    """
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    # Datetimes are passed through to JSONEncoder too; orjson's native
+    # format has microseconds and +00:00 where DRF writes milliseconds and Z
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=JSONEncoder().default, option=self.options)
@@ -55,6 +55,7 @@ INSTALLED_APPS = [
     "rest_framework",
     "django_filters",
     "corsheaders",
+    "cachalot",
     # Mis apps
     "users.apps.UsersConfig",
     "assets.apps.AssetsConfig",
@@ -64,6 +65,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.gzip.GZipMiddleware",  # Before anything that reads or writes the body
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -99,6 +101,27 @@ WSGI_APPLICATION = "sigat.wsgi.application"
 
 DATABASES = {"default": env.db("DATABASE_URL")}
 
+# Shared cache (e.g. redis://...) in production; locmem is per-process
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+SHARED_CACHE = not CACHES["default"]["BACKEND"].endswith(("LocMemCache", "DummyCache"))
+
+# django-cachalot caches ORM query results and invalidates them per table on
+# writes. Invalidations only reach other workers through a shared cache, so
+# it stays off on a per-process one. The audit log is written on every
+# tracked save and rarely read, so caching it would only churn the cache.
+CACHALOT_ENABLED = SHARED_CACHE
+CACHALOT_CACHE = "default"
+CACHALOT_UNCACHABLE_TABLES = frozenset(("django_migrations", "auditing_auditlog"))
+
+# Admin sessions are read from the shared cache, writes still go through to
+# the DB. On a per-process cache another worker could keep serving a session
+# that was logged out elsewhere, so they stay in the DB there.
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db"
+    if SHARED_CACHE
+    else "django.contrib.sessions.backends.db"
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -146,6 +169,10 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "sigat.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "PAGE_SIZE_QUERY_PARAM": "page_size",
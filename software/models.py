@@ -1,5 +1,6 @@
 from django.db import models
 from assets.models import Asset
+from auditing.mixins import AuditedModelMixin
 
 
 class Vulnerability(models.Model):
@@ -16,7 +17,7 @@ class Vulnerability(models.Model):
         return self.cve_id
 
 
-class SoftwareCatalog(models.Model):
+class SoftwareCatalog(AuditedModelMixin, models.Model):
     name = models.CharField(max_length=255)
     developer = models.CharField(max_length=255, blank=True)
 
@@ -33,7 +34,7 @@ class SoftwareCatalog(models.Model):
         return f"{self.name} ({self.developer})"
 
 
-class License(models.Model):
+class License(AuditedModelMixin, models.Model):
     software = models.ForeignKey(
         SoftwareCatalog, on_delete=models.CASCADE, related_name="licenses"
     )
@@ -12,6 +12,17 @@ class CustomUserAdmin(UserAdmin):
         ('Información Adicional', {'fields': ('role',)}),
     )
 
+
+class EmployeeAdmin(admin.ModelAdmin):
+    # Required by AssetAdmin.autocomplete_fields
+    search_fields = ("rut", "first_name", "last_name")
+
+
+class DepartmentAdmin(admin.ModelAdmin):
+    # Required by AssetAdmin.autocomplete_fields
+    search_fields = ("name",)
+
+
 admin.site.register(CustomUser, CustomUserAdmin)
-admin.site.register(Employee)
-admin.site.register(Department)
\ No newline at end of file
+admin.site.register(Employee, EmployeeAdmin)
+admin.site.register(Department, DepartmentAdmin)
\ No newline at end of file
@@ -1,9 +1,10 @@
 from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from auditing.mixins import AuditedModelMixin
 
 
-class Department(models.Model):
+class Department(AuditedModelMixin, models.Model):
     name = models.CharField(max_length=200, unique=True, verbose_name="Nombre")
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name="Fecha de Creación"
@@ -13,7 +14,7 @@ class Department(models.Model):
         return self.name
 
 
-class CustomUser(AbstractUser):
+class CustomUser(AuditedModelMixin, AbstractUser):
     class RoleChoices(models.TextChoices):
         TECHNICIAN = "TECHNICIAN", "Técnico"
         ADMIN = "ADMIN", "Administrador"
@@ -48,7 +49,7 @@ class CustomUser(AbstractUser):
         super().save(*args, **kwargs)
 
 
-class Employee(models.Model):
+class Employee(AuditedModelMixin, models.Model):
     rut = models.CharField(max_length=12, unique=True)
     first_name = models.CharField(max_length=150, verbose_name="Nombres")
     last_name = models.CharField(max_length=150, verbose_name="Apellidos")